@@ -5,7 +5,10 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any
+import re
+import threading
+from datetime import datetime
+from typing import Any, Iterator, Sequence
 
 import google.auth
 from google.cloud import bigquery
@@ -13,6 +16,9 @@ from google.oauth2 import service_account
 
 from ..schema.common import EvidenceSource
 
+# project.dataset.table or dataset.table - table names can't be query parameters
+_TABLE_ID_RE = re.compile(r"^[A-Za-z0-9_-]+(\.[A-Za-z0-9_-]+){1,2}$")
+
 
 class GHArchiveClient:
     """Client for GH Archive BigQuery queries.
@@ -22,24 +28,36 @@ class GHArchiveClient:
     - Inline JSON: {"type":"service_account","project_id":"..."}
 
     Falls back to Application Default Credentials (gcloud, metadata server).
+
+    By default each query scans the ``githubarchive.day.YYYYMMDD`` table for the
+    requested day. Pass ``table`` to query a narrower copy instead (e.g. a cached
+    slice of a known incident window); rows are then filtered by date as well.
     """
 
-    def __init__(self, project_id: str | None = None):
+    def __init__(self, project_id: str | None = None, table: str | None = None):
+        if table and not _TABLE_ID_RE.match(table):
+            raise ValueError(f"Invalid BigQuery table id: {table}")
         self.project_id = project_id
+        self.table = table
         self._client: bigquery.Client | None = None
+        self._client_lock = threading.Lock()
 
     @property
     def source(self) -> EvidenceSource:
         return EvidenceSource.GHARCHIVE
 
     def _get_client(self) -> bigquery.Client:
-        if self._client is None:
-            credentials, project = self._resolve_credentials()
-            self._client = bigquery.Client(
-                credentials=credentials,
-                project=self.project_id or project,
-            )
-        return self._client
+        if self._client is not None:
+            return self._client
+        # Resolve credentials and build the client once, even across threads
+        with self._client_lock:
+            if self._client is None:
+                credentials, project = self._resolve_credentials()
+                self._client = bigquery.Client(
+                    credentials=credentials,
+                    project=self.project_id or project,
+                )
+            return self._client
 
     def _resolve_credentials(self) -> tuple[Any, str | None]:
         """Resolve credentials - supports file path or inline JSON."""
@@ -64,8 +82,30 @@ class GHArchiveClient:
         event_type: str | None = None,
         from_date: str = "",
         to_date: str | None = None,
+        event_types: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Query GH Archive for events using parameterized queries."""
+        """Query GH Archive for events using parameterized queries.
+
+        Pass ``event_types`` to fetch several event types in a single scan
+        instead of one query per type.
+        """
+        return list(self.iter_events(repo, actor, event_type, from_date, to_date, event_types))
+
+    def iter_events(
+        self,
+        repo: str | None = None,
+        actor: str | None = None,
+        event_type: str | None = None,
+        from_date: str = "",
+        to_date: str | None = None,
+        event_types: Sequence[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Like query_events, but yield rows as BigQuery result pages arrive.
+
+        The query is validated and submitted immediately; only row conversion
+        is deferred, so callers can parse each row without first holding the
+        whole result set as dicts.
+        """
         client = self._get_client()
 
         # Build table reference - use daily table
@@ -74,12 +114,18 @@ class GHArchiveClient:
         # Table names can't be parameterized, but day is validated format
         if not day.isdigit() or len(day) != 8:
             raise ValueError(f"Invalid date format: {from_date}")
-        table = f"`githubarchive.day.{day}`"
 
         # Build WHERE clauses with parameterized values
         clauses = []
         params = []
 
+        if self.table:
+            table = f"`{self.table}`"
+            clauses.append("DATE(created_at) = @day")
+            params.append(bigquery.ScalarQueryParameter("day", "DATE", datetime.strptime(day, "%Y%m%d").date()))
+        else:
+            table = f"`githubarchive.day.{day}`"
+
         # Filter by hour and minute using created_at timestamp
         hour = int(from_date[8:10])
         minute = int(from_date[10:12])
@@ -97,6 +143,9 @@ class GHArchiveClient:
         if event_type:
             clauses.append("type = @event_type")
             params.append(bigquery.ScalarQueryParameter("event_type", "STRING", event_type))
+        if event_types:
+            clauses.append("type IN UNNEST(@event_types)")
+            params.append(bigquery.ArrayQueryParameter("event_types", "STRING", list(event_types)))
 
         where = " AND ".join(clauses) if clauses else "1=1"
 
@@ -117,4 +166,4 @@ class GHArchiveClient:
 
         job_config = bigquery.QueryJobConfig(query_parameters=params)
         results = client.query(query, job_config=job_config)
-        return [dict(row) for row in results]
+        return (dict(row) for row in results)
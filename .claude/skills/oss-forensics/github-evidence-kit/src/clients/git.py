@@ -32,32 +32,21 @@ class GitClient:
             # Enhance error message with stderr
             raise RuntimeError(f"Git command failed: {' '.join(args)}\nError: {e.stderr}") from e
 
+    # %H: commit hash
+    # %an: author name
+    # %ae: author email
+    # %aI: author date, strict ISO 8601 format
+    # %cn: committer name
+    # %ce: committer email
+    # %cI: committer date, strict ISO 8601 format
+    # %P: parent hashes
+    # %B: raw body (unwrapped subject and body)
+    _COMMIT_FORMAT = "%H%n%an%n%ae%n%aI%n%cn%n%ce%n%cI%n%P%n%B"
+
     def get_commit(self, sha: str) -> dict[str, Any]:
         """Get commit info from local git."""
-        # %H: commit hash
-        # %an: author name
-        # %ae: author email
-        # %aI: author date, strict ISO 8601 format
-        # %cn: committer name
-        # %ce: committer email
-        # %cI: committer date, strict ISO 8601 format
-        # %P: parent hashes
-        # %B: raw body (unwrapped subject and body)
-        format_str = "%H%n%an%n%ae%n%aI%n%cn%n%ce%n%cI%n%P%n%B"
-        output = self._run("show", "-s", f"--format={format_str}", sha)
-        lines = output.split("\n")
-
-        return {
-            "sha": lines[0],
-            "author_name": lines[1],
-            "author_email": lines[2],
-            "author_date": lines[3],
-            "committer_name": lines[4],
-            "committer_email": lines[5],
-            "committer_date": lines[6],
-            "parents": lines[7].split() if lines[7] else [],
-            "message": "\n".join(lines[8:]),
-        }
+        output = self._run("show", "-s", f"--format={self._COMMIT_FORMAT}", sha)
+        return _parse_commit(output)
 
     def get_commit_files(self, sha: str) -> list[dict[str, Any]]:
         """Get files changed in a commit."""
@@ -65,13 +54,25 @@ class GitClient:
         # --name-status: show only names and status of changed files
         # -r: recursive
         output = self._run("diff-tree", "--no-commit-id", "--name-status", "-r", sha)
-        files = []
-        for line in output.split("\n"):
-            if line:
-                parts = line.split("\t")
-                status_map = {"A": "added", "M": "modified", "D": "removed", "R": "renamed"}
-                files.append({"status": status_map.get(parts[0][0], "modified"), "filename": parts[-1]})
-        return files
+        return _parse_name_status(output)
+
+    def get_commit_with_files(self, sha: str) -> dict[str, Any]:
+        """Get commit info plus its changed files (as ``"files"``) in one git call.
+
+        Equivalent to get_commit followed by get_commit_files, but spawns a
+        single process instead of two.
+        """
+        # log.showRoot=false and --no-renames match diff-tree's defaults;
+        # %x00 separates the free-form message from the file list
+        output = self._run(
+            "-c", "log.showRoot=false",
+            "log", "-1", "--no-renames", "--name-status",
+            f"--format={self._COMMIT_FORMAT}%x00", sha,
+        )
+        header, _, name_status = output.partition("\0")
+        commit = _parse_commit(header.rstrip())
+        commit["files"] = _parse_name_status(name_status)
+        return commit
 
     def get_log(
         self,
@@ -119,3 +120,32 @@ class GitClient:
     def cat_file(self, object_sha: str) -> str:
         """Get raw content of an object."""
         return self._run("cat-file", "-p", object_sha)
+
+
+_STATUS_MAP = {"A": "added", "M": "modified", "D": "removed", "R": "renamed"}
+
+
+def _parse_commit(output: str) -> dict[str, Any]:
+    """Parse the output of GitClient._COMMIT_FORMAT."""
+    lines = output.split("\n")
+    return {
+        "sha": lines[0],
+        "author_name": lines[1],
+        "author_email": lines[2],
+        "author_date": lines[3],
+        "committer_name": lines[4],
+        "committer_email": lines[5],
+        "committer_date": lines[6],
+        "parents": lines[7].split() if lines[7] else [],
+        "message": "\n".join(lines[8:]),
+    }
+
+
+def _parse_name_status(output: str) -> list[dict[str, Any]]:
+    """Parse ``--name-status`` lines into file change dicts."""
+    files = []
+    for line in output.split("\n"):
+        if line:
+            parts = line.split("\t")
+            files.append({"status": _STATUS_MAP.get(parts[0][0], "modified"), "filename": parts[-1]})
+    return files
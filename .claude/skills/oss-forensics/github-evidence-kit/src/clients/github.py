@@ -3,7 +3,13 @@ GitHub API Client (Unauthenticated).
 """
 from __future__ import annotations
 
+import json
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
 from typing import Any
+from urllib.parse import urlencode
 
 from ..schema.common import EvidenceSource
 
@@ -13,26 +19,43 @@ class GitHubClient:
 
     Rate limits: 60 requests/hour unauthenticated.
     All public repository data is accessible without authentication.
+
+    Pass ``cache_path`` to keep responses in a SQLite file and revalidate
+    them with ``If-None-Match``: an unchanged resource comes back as a
+    bodyless 304 and is served from the file. GitHub only exempts 304s from
+    the rate limit for authenticated requests, so here they still count.
     """
 
     BASE_URL = "https://api.github.com"
 
-    def __init__(self):
+    def __init__(self, cache_path: str | Path | None = None):
         self._session: Any = None
+        self._session_lock = threading.Lock()
+        self.cache_path = Path(cache_path) if cache_path else None
+        if self.cache_path:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(self.cache_path)) as conn, conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, etag TEXT, body TEXT)")
 
     @property
     def source(self) -> EvidenceSource:
         return EvidenceSource.GITHUB
 
     def _get_session(self) -> Any:
-        if self._session is None:
+        if self._session is not None:
+            return self._session
+        # Threads sharing the client (verify_all) must not each build a session
+        with self._session_lock:
+            if self._session is not None:
+                return self._session
+
             import requests
             from requests.adapters import HTTPAdapter
             from urllib3.util.retry import Retry
 
-            self._session = requests.Session()
-            self._session.headers.update({"Accept": "application/vnd.github+json"})
-            
+            session = requests.Session()
+            session.headers.update({"Accept": "application/vnd.github+json"})
+
             # Add retry logic
             retries = Retry(
                 total=3,
@@ -41,81 +64,67 @@ class GitHubClient:
                 allowed_methods=["GET"]
             )
             adapter = HTTPAdapter(max_retries=retries)
-            self._session.mount("https://", adapter)
-            self._session.mount("http://", adapter)
-            
-        return self._session
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+            # Publish only once fully configured
+            self._session = session
+            return session
+
+    def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """GET a GitHub API path and decode the JSON body, revalidating cached copies."""
+        session = self._get_session()
+        url = f"{self.BASE_URL}{path}"
+        if not self.cache_path:
+            resp = session.get(url, params=params)
+            resp.raise_for_status()
+            return resp.json()
+
+        # Fresh connection per call: verify_all shares the client across threads
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        with closing(sqlite3.connect(self.cache_path)) as conn, conn:
+            cached = conn.execute("SELECT etag, body FROM responses WHERE url = ?", (key,)).fetchone()
+            headers = {"If-None-Match": cached[0]} if cached else None
+            resp = session.get(url, params=params, headers=headers)
+            if cached and resp.status_code == 304:
+                return json.loads(cached[1])
+            resp.raise_for_status()
+            if etag := resp.headers.get("ETag"):
+                conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, etag, resp.text))
+            return resp.json()
 
     def get_commit(self, owner: str, repo: str, sha: str) -> dict[str, Any]:
         """Fetch commit from GitHub API."""
-        session = self._get_session()
-        url = f"{self.BASE_URL}/repos/{owner}/{repo}/commits/{sha}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get(f"/repos/{owner}/{repo}/commits/{sha}")
 
     def get_issue(self, owner: str, repo: str, number: int) -> dict[str, Any]:
         """Fetch issue from GitHub API."""
-        session = self._get_session()
-        url = f"{self.BASE_URL}/repos/{owner}/{repo}/issues/{number}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get(f"/repos/{owner}/{repo}/issues/{number}")
 
     def get_pull_request(self, owner: str, repo: str, number: int) -> dict[str, Any]:
         """Fetch PR from GitHub API."""
-        session = self._get_session()
-        url = f"{self.BASE_URL}/repos/{owner}/{repo}/pulls/{number}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get(f"/repos/{owner}/{repo}/pulls/{number}")
 
     def get_file(self, owner: str, repo: str, path: str, ref: str = "HEAD") -> dict[str, Any]:
         """Fetch file content from GitHub API."""
-        session = self._get_session()
-        url = f"{self.BASE_URL}/repos/{owner}/{repo}/contents/{path}"
-        params = {"ref": ref}
-        resp = session.get(url, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get(f"/repos/{owner}/{repo}/contents/{path}", params={"ref": ref})
 
     def get_branch(self, owner: str, repo: str, branch: str) -> dict[str, Any]:
         """Fetch branch from GitHub API."""
-        session = self._get_session()
-        url = f"{self.BASE_URL}/repos/{owner}/{repo}/branches/{branch}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get(f"/repos/{owner}/{repo}/branches/{branch}")
 
     def get_tag(self, owner: str, repo: str, tag: str) -> dict[str, Any]:
         """Fetch tag from GitHub API."""
-        session = self._get_session()
-        url = f"{self.BASE_URL}/repos/{owner}/{repo}/git/refs/tags/{tag}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get(f"/repos/{owner}/{repo}/git/refs/tags/{tag}")
 
     def get_release(self, owner: str, repo: str, tag: str) -> dict[str, Any]:
         """Fetch release by tag from GitHub API."""
-        session = self._get_session()
-        url = f"{self.BASE_URL}/repos/{owner}/{repo}/releases/tags/{tag}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get(f"/repos/{owner}/{repo}/releases/tags/{tag}")
 
     def get_forks(self, owner: str, repo: str, per_page: int = 100) -> list[dict[str, Any]]:
         """Fetch forks from GitHub API."""
-        session = self._get_session()
-        url = f"{self.BASE_URL}/repos/{owner}/{repo}/forks"
-        params = {"per_page": per_page}
-        resp = session.get(url, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get(f"/repos/{owner}/{repo}/forks", params={"per_page": per_page})
 
     def get_repo(self, owner: str, repo: str) -> dict[str, Any]:
         """Fetch repository info from GitHub API."""
-        session = self._get_session()
-        url = f"{self.BASE_URL}/repos/{owner}/{repo}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get(f"/repos/{owner}/{repo}")
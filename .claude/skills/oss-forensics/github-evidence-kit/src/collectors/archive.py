@@ -3,8 +3,7 @@ GH Archive Collector.
 """
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
+from typing import Iterator, Sequence
 
 from ..clients.gharchive import GHArchiveClient
 from ..schema.common import EvidenceSource, VerificationInfo
@@ -12,18 +11,22 @@ from ..schema.events import AnyEvent
 from ..schema.observations import CommitAuthor, CommitObservation, IssueObservation
 from ..helpers import (
     generate_evidence_id,
+    json_loads,
     make_actor,
     make_repo,
     parse_datetime_strict,
 )
-from ..parsers import parse_gharchive_event
+from ..parsers import parse_gharchive_event, parse_gharchive_events
 
 
 class GHArchiveCollector:
     """Collects evidence from GH Archive (BigQuery)."""
 
-    def __init__(self, client: GHArchiveClient | None = None):
-        self.client = client or GHArchiveClient()
+    def __init__(self, client: GHArchiveClient | None = None, table_id: str | None = None):
+        """Pass ``table_id`` to query a partitioned/cached copy instead of the day tables."""
+        if client is not None and table_id is not None:
+            raise ValueError("Pass either 'client' or 'table_id', not both; configure the table on the client")
+        self.client = client or GHArchiveClient(table=table_id)
 
     def collect_events(
         self,
@@ -33,26 +36,56 @@ class GHArchiveCollector:
         event_type: str | None = None,
     ) -> list[AnyEvent]:
         """Collect events from GH Archive."""
+        rows = self._query_minute(timestamp, repo, actor, [event_type] if event_type else None)
+        # Raise error on malformed rows instead of silently skipping
+        return parse_gharchive_events(rows, self.client.table)
+
+    def collect_events_multi(
+        self,
+        timestamp: str,
+        event_types: Sequence[str],
+        repo: str | None = None,
+        actor: str | None = None,
+    ) -> dict[str, list[AnyEvent]]:
+        """Collect several event types from one GH Archive scan.
+
+        Returns events grouped by GH Archive type name (e.g. "IssuesEvent").
+        Every requested type is present in the result, possibly empty.
+        """
+        grouped: dict[str, list[AnyEvent]] = {t: [] for t in event_types}
+        for row in self._query_minute(timestamp, repo, actor, event_types):
+            grouped[row["type"]].append(parse_gharchive_event(row, self.client.table))
+        return grouped
+
+    def _query_minute(
+        self,
+        timestamp: str,
+        repo: str | None,
+        actor: str | None,
+        event_types: Sequence[str] | None,
+    ) -> Iterator[dict]:
+        """Validate arguments and stream one minute of GH Archive rows."""
         if len(timestamp) != 12 or not timestamp.isdigit():
             raise ValueError(f"timestamp must be YYYYMMDDHHMM format (12 digits), got: {timestamp}")
 
         if not repo and not actor:
             raise ValueError("Must specify at least 'repo' or 'actor' to avoid expensive full-table scans")
 
-        rows = self.client.query_events(
+        # None means every type; an empty list would silently drop the type filter
+        if event_types is not None and not event_types:
+            raise ValueError("event_types must name at least one event type")
+
+        return self.client.iter_events(
             repo=repo,
             actor=actor,
-            event_type=event_type,
+            event_types=event_types,
             from_date=timestamp,
             to_date=timestamp,
         )
 
-        events = []
-        for row in rows:
-            # Raise error on malformed rows instead of silently skipping
-            events.append(parse_gharchive_event(row))
-
-        return events
+    def _recovery_table(self, date: str) -> str:
+        """Table recorded as provenance: the configured copy, else the day table."""
+        return self.client.table or f"githubarchive.day.{date}"
 
     def recover_issue(self, repo: str, issue_number: int, timestamp: str) -> IssueObservation:
         """Recover deleted issue content from GH Archive."""
@@ -74,7 +107,7 @@ class GHArchiveCollector:
             if timestamp not in row_ts:
                 continue
 
-            payload = json.loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"]
+            payload = json_loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"]
             for commit in payload.get("commits", []):
                 if commit["sha"].startswith(sha) or sha.startswith(commit["sha"]):
                     return CommitObservation(
@@ -88,7 +121,7 @@ class GHArchiveCollector:
                         repository=make_repo(owner, name),
                         verification=VerificationInfo(
                             source=EvidenceSource.GHARCHIVE,
-                            bigquery_table=f"githubarchive.day.{date}",
+                            bigquery_table=self._recovery_table(date),
                             query=f"repo.name='{repo}' AND type='PushEvent' AND created_at='{timestamp}'",
                         ),
                         sha=commit["sha"],
@@ -122,7 +155,7 @@ class GHArchiveCollector:
             if timestamp not in row_ts:
                 continue
 
-            payload = json.loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"]
+            payload = json_loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"]
             size = int(payload.get("size", 0))
             before_sha = payload.get("before", "0" * 40)
 
@@ -138,7 +171,7 @@ class GHArchiveCollector:
                     repository=make_repo(owner, name),
                     verification=VerificationInfo(
                         source=EvidenceSource.GHARCHIVE,
-                        bigquery_table=f"githubarchive.day.{date}",
+                        bigquery_table=self._recovery_table(date),
                         query=f"repo.name='{repo}' AND type='PushEvent' AND created_at='{timestamp}' AND size=0",
                     ),
                     sha=before_sha,
@@ -172,7 +205,7 @@ class GHArchiveCollector:
         rows = self.client.query_events(repo=repo, event_type=event_type, from_date=date)
 
         for row in rows:
-            payload = json.loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"]
+            payload = json_loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"]
             item = payload.get(payload_key, {})
             row_ts = str(row.get("created_at", ""))
 
@@ -195,7 +228,7 @@ class GHArchiveCollector:
                     repository=make_repo(owner, name),
                     verification=VerificationInfo(
                         source=EvidenceSource.GHARCHIVE,
-                        bigquery_table=f"githubarchive.day.{date}",
+                        bigquery_table=self._recovery_table(date),
                         query=f"repo.name='{repo}' AND type='{event_type}' AND created_at='{timestamp}'",
                     ),
                     issue_number=number,
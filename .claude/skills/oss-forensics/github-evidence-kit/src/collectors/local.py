@@ -19,8 +19,7 @@ class LocalGitCollector:
 
     def collect_commit(self, sha: str) -> CommitObservation:
         """Collect commit evidence from local git."""
-        data = self.client.get_commit(sha)
-        files_data = self.client.get_commit_files(data["sha"])
+        data = self.client.get_commit_with_files(sha)
         now = datetime.now(timezone.utc)
 
         files = [
@@ -30,7 +29,7 @@ class LocalGitCollector:
                 additions=0,
                 deletions=0,
             )
-            for f in files_data
+            for f in data["files"]
         ]
 
         return CommitObservation(
@@ -76,8 +75,7 @@ class LocalGitCollector:
                 if len(parts) >= 3:
                     sha = parts[2]
                     try:
-                        commit = self.collect_commit(sha)
-                        commit.is_dangling = True
+                        commit = self.collect_commit(sha).model_copy(update={"is_dangling": True})
                         dangling_commits.append(commit)
                     except Exception:
                         # Ignore if we can't parse it
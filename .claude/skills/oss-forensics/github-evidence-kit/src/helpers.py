@@ -5,11 +5,45 @@ Shared helper functions for evidence creation and parsing.
 from __future__ import annotations
 
 import hashlib
+import json
+import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 from .schema.common import GitHubActor, GitHubRepository
 
+# GH Archive payloads are JSON strings decoded once per row; orjson is an
+# optional C decoder that is several times faster than the stdlib.
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+else:
+    # Older releases decode integers beyond 64 bits as floats instead of
+    # rejecting them; that loss can't be detected per call, so skip those.
+    try:
+        _orjson.loads("18446744073709551616")
+    except _orjson.JSONDecodeError:
+        pass
+    else:
+        _orjson = None
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Decode JSON to the same objects as ``json.loads``, via orjson when available.
+
+    orjson rejects some input the stdlib accepts (lone surrogate escapes,
+    integers beyond 64 bits in newer releases); those are decoded again with
+    ``json.loads``, so one odd GH Archive row does not abort a whole query.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 def generate_evidence_id(prefix: str, *parts: str) -> str:
     """Generate a deterministic evidence ID.
@@ -36,19 +70,20 @@ _DATETIME_FORMATS = [
 
 def _try_parse_datetime(dt_str: str) -> datetime | None:
     """Attempt to parse datetime string. Returns None if all formats fail."""
-    # Handle Z suffix for ISO format
+    # Try fromisoformat first (handles most ISO formats, and the Z suffix of
+    # GH Archive/GitHub timestamps on Python 3.11+ without building a new string)
+    try:
+        return datetime.fromisoformat(dt_str)
+    except ValueError:
+        pass
+
+    # Python < 3.11 rejects the Z suffix
     if dt_str.endswith("Z"):
         try:
             return datetime.fromisoformat(dt_str[:-1] + "+00:00")
         except ValueError:
             pass
 
-    # Try fromisoformat first (handles most ISO formats)
-    try:
-        return datetime.fromisoformat(dt_str)
-    except ValueError:
-        pass
-
     # Fall back to strptime for edge cases
     for fmt in _DATETIME_FORMATS:
         try:
@@ -93,16 +128,35 @@ def parse_datetime_strict(dt_str: str | datetime | None) -> datetime | None:
     raise ValueError(f"Unable to parse datetime: {dt_str}")
 
 
+def intern_str(value: Any) -> Any:
+    """Intern low-cardinality strings (logins, repo names, refs).
+
+    A GH Archive scan repeats the same few actors and repositories across
+    thousands of rows; interning keeps one shared string per distinct value.
+    Non-strings pass through for the model to validate.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+# Actors and repositories are frozen, so one instance per distinct value can
+# be shared by every evidence item that references it instead of being
+# re-validated per row.
+_SUBMODEL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_SUBMODEL_CACHE_SIZE)
 def make_actor(login: str, actor_id: int | None = None) -> GitHubActor:
     """Create GitHubActor from components."""
-    return GitHubActor(login=login, id=actor_id)
+    return GitHubActor(login=intern_str(login), id=actor_id)
 
 
+@lru_cache(maxsize=_SUBMODEL_CACHE_SIZE)
 def make_repo(owner: str, name: str) -> GitHubRepository:
     """Create GitHubRepository from owner and name."""
-    return GitHubRepository(owner=owner, name=name, full_name=f"{owner}/{name}")
+    return GitHubRepository(owner=intern_str(owner), name=intern_str(name), full_name=intern_str(f"{owner}/{name}"))
 
 
+@lru_cache(maxsize=_SUBMODEL_CACHE_SIZE)
 def make_repo_from_full_name(full_name: str) -> GitHubRepository:
     """Create GitHubRepository from full name (owner/repo format).
 
@@ -120,4 +174,4 @@ def make_repo_from_full_name(full_name: str) -> GitHubRepository:
     if not owner or not name or owner == "unknown" or name == "unknown":
         raise ValueError(f"Invalid repository full_name: '{full_name}' - owner and name must be valid")
 
-    return GitHubRepository(owner=owner, name=name, full_name=full_name)
+    return GitHubRepository(owner=intern_str(owner), name=intern_str(name), full_name=intern_str(full_name))
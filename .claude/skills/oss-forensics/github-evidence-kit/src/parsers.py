@@ -7,11 +7,13 @@ Each parser extracts structured data from raw GH Archive JSON payloads.
 
 from __future__ import annotations
 
-import json
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable
 
 from .helpers import (
     generate_evidence_id,
+    intern_str,
+    json_loads,
     make_actor,
     make_repo_from_full_name,
     parse_datetime_lenient,
@@ -42,6 +44,12 @@ from .schema.events import (
 )
 
 
+@lru_cache(maxsize=None)
+def _gharchive_verification(table: str | None) -> VerificationInfo:
+    """Shared, frozen verification info for every row from one table."""
+    return VerificationInfo(source=EvidenceSource.GHARCHIVE, bigquery_table=table)
+
+
 class _RowContext:
     """Extracted common data from a GH Archive row."""
 
@@ -49,7 +57,7 @@ class _RowContext:
 
     def __init__(self, row: dict[str, Any], table: str | None = None):
         self.row = row
-        self.payload = json.loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"]
+        self.payload = json_loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"]
         self.when = parse_datetime_lenient(row.get("created_at"))
         self.who = make_actor(row.get("actor_login", "unknown"), row.get("actor_id"))
 
@@ -82,10 +90,35 @@ class _RowContext:
                 month = self.when.strftime("%Y%m")
                 table = f"githubarchive.month.{month}"
 
-        self.verification = VerificationInfo(
-            source=EvidenceSource.GHARCHIVE,
-            bigquery_table=table,
-        )
+        self.verification = _gharchive_verification(table)
+
+
+# =============================================================================
+# PAYLOAD VALUE MAPS
+#
+# Built once at import rather than per row. Values not listed fall back to
+# each parser's default, so extend these when enum members are added.
+# =============================================================================
+
+_ISSUE_ACTIONS = {
+    "opened": IssueAction.OPENED,
+    "closed": IssueAction.CLOSED,
+    "reopened": IssueAction.REOPENED,
+    "deleted": IssueAction.DELETED,
+}
+_PR_ACTIONS = {"opened": PRAction.OPENED, "closed": PRAction.CLOSED, "reopened": PRAction.REOPENED}
+_CREATE_REF_TYPES = {"branch": RefType.BRANCH, "tag": RefType.TAG, "repository": RefType.REPOSITORY}
+_DELETE_REF_TYPES = {"branch": RefType.BRANCH, "tag": RefType.TAG}
+# MemberEvent actions in GitHub are: added, removed, edited
+_MEMBER_ACTIONS = {"added": "added", "removed": "removed"}
+# Normalize action to valid Literal values
+_RELEASE_ACTIONS = {"published": "published", "created": "created", "deleted": "deleted"}
+_WORKFLOW_ACTIONS = {"requested": "requested", "completed": "completed", "in_progress": "in_progress"}
+_WORKFLOW_CONCLUSIONS = {
+    "success": WorkflowConclusion.SUCCESS,
+    "failure": WorkflowConclusion.FAILURE,
+    "cancelled": WorkflowConclusion.CANCELLED,
+}
 
 
 # =============================================================================
@@ -105,8 +138,8 @@ def parse_push_event(row: dict[str, Any], table: str | None = None) -> PushEvent
             CommitInPush(
                 sha=c.get("sha", ""),
                 message=c.get("message", ""),
-                author_name=author.get("name", ""),
-                author_email=author.get("email", ""),
+                author_name=intern_str(author.get("name", "")),
+                author_email=intern_str(author.get("email", "")),
             )
         )
 
@@ -114,7 +147,7 @@ def parse_push_event(row: dict[str, Any], table: str | None = None) -> PushEvent
     after_sha = payload.get("head", payload.get("after", "0" * 40))
     size = int(payload.get("size", len(commits)))
     is_force_push = size == 0 and before_sha != "0" * 40
-    ref = payload.get("ref", "")
+    ref = intern_str(payload.get("ref", ""))
 
     return PushEvent(
         evidence_id=generate_evidence_id("push", ctx.repository.full_name, after_sha),
@@ -138,13 +171,7 @@ def parse_issue_event(row: dict[str, Any], table: str | None = None) -> IssueEve
     issue = ctx.payload.get("issue", {})
 
     action_str = ctx.payload.get("action", "opened")
-    action_map = {
-        "opened": IssueAction.OPENED,
-        "closed": IssueAction.CLOSED,
-        "reopened": IssueAction.REOPENED,
-        "deleted": IssueAction.DELETED,
-    }
-    action = action_map.get(action_str, IssueAction.OPENED)
+    action = _ISSUE_ACTIONS.get(action_str, IssueAction.OPENED)
     issue_number = issue.get("number", 0)
 
     return IssueEvent(
@@ -166,8 +193,7 @@ def parse_create_event(row: dict[str, Any], table: str | None = None) -> CreateE
     ctx = _RowContext(row, table)
 
     ref_type_str = ctx.payload.get("ref_type", "branch")
-    ref_type_map = {"branch": RefType.BRANCH, "tag": RefType.TAG, "repository": RefType.REPOSITORY}
-    ref_type = ref_type_map.get(ref_type_str, RefType.BRANCH)
+    ref_type = _CREATE_REF_TYPES.get(ref_type_str, RefType.BRANCH)
     ref_name = ctx.payload.get("ref", "")
 
     return CreateEvent(
@@ -188,8 +214,7 @@ def parse_pull_request_event(row: dict[str, Any], table: str | None = None) -> P
     pr = ctx.payload.get("pull_request", {})
 
     action_str = ctx.payload.get("action", "opened")
-    action_map = {"opened": PRAction.OPENED, "closed": PRAction.CLOSED, "reopened": PRAction.REOPENED}
-    action = action_map.get(action_str, PRAction.OPENED)
+    action = _PR_ACTIONS.get(action_str, PRAction.OPENED)
     if action_str == "closed" and pr.get("merged"):
         action = PRAction.MERGED
 
@@ -268,8 +293,7 @@ def parse_delete_event(row: dict[str, Any], table: str | None = None) -> DeleteE
     ctx = _RowContext(row, table)
 
     ref_type_str = ctx.payload.get("ref_type", "branch")
-    ref_type_map = {"branch": RefType.BRANCH, "tag": RefType.TAG}
-    ref_type = ref_type_map.get(ref_type_str, RefType.BRANCH)
+    ref_type = _DELETE_REF_TYPES.get(ref_type_str, RefType.BRANCH)
     ref_name = ctx.payload.get("ref", "")
 
     return DeleteEvent(
@@ -289,10 +313,7 @@ def parse_member_event(row: dict[str, Any], table: str | None = None) -> MemberE
     ctx = _RowContext(row, table)
     member = ctx.payload.get("member", {})
     action = ctx.payload.get("action", "added")
-
-    # MemberEvent actions in GitHub are: added, removed, edited
-    action_map = {"added": "added", "removed": "removed"}
-    normalized_action = action_map.get(action, "added")
+    normalized_action = _MEMBER_ACTIONS.get(action, "added")
 
     return MemberEvent(
         evidence_id=generate_evidence_id("member", ctx.repository.full_name, member.get("login", ""), action),
@@ -326,10 +347,7 @@ def parse_release_event(row: dict[str, Any], table: str | None = None) -> Releas
     release = ctx.payload.get("release", {})
     action = ctx.payload.get("action", "published")
     tag_name = release.get("tag_name", "")
-
-    # Normalize action to valid Literal values
-    action_map = {"published": "published", "created": "created", "deleted": "deleted"}
-    normalized_action = action_map.get(action, "published")
+    normalized_action = _RELEASE_ACTIONS.get(action, "published")
 
     return ReleaseEvent(
         evidence_id=generate_evidence_id("release", ctx.repository.full_name, tag_name, action),
@@ -350,17 +368,12 @@ def parse_workflow_run_event(row: dict[str, Any], table: str | None = None) -> W
     ctx = _RowContext(row, table)
     workflow_run = ctx.payload.get("workflow_run", {})
     action = ctx.payload.get("action", "requested")
-
-    # Normalize action
-    action_map = {"requested": "requested", "completed": "completed", "in_progress": "in_progress"}
-    normalized_action = action_map.get(action, "requested")
+    normalized_action = _WORKFLOW_ACTIONS.get(action, "requested")
 
     # Parse conclusion if completed
     conclusion = None
     if normalized_action == "completed":
-        conclusion_str = workflow_run.get("conclusion", "")
-        conclusion_map = {"success": WorkflowConclusion.SUCCESS, "failure": WorkflowConclusion.FAILURE, "cancelled": WorkflowConclusion.CANCELLED}
-        conclusion = conclusion_map.get(conclusion_str)
+        conclusion = _WORKFLOW_CONCLUSIONS.get(workflow_run.get("conclusion", ""))
 
     workflow_name = workflow_run.get("name", "unknown")
     head_sha = workflow_run.get("head_sha", "0" * 40)
@@ -413,3 +426,12 @@ def parse_gharchive_event(row: dict[str, Any], table: str | None = None) -> Any:
         supported = ", ".join(_PARSERS.keys())
         raise ValueError(f"Unsupported GH Archive event type: {event_type}. Supported: {supported}")
     return parser(row, table)
+
+
+def parse_gharchive_events(rows: Iterable[dict[str, Any]], table: str | None = None) -> list[Any]:
+    """Parse a batch of GH Archive rows, e.g. one query result.
+
+    Accepts any iterable, so streamed query results are parsed as they
+    arrive. Raises ValueError on the first unsupported event type.
+    """
+    return [parse_gharchive_event(row, table) for row in rows]
@@ -7,7 +7,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, HttpUrl, model_validator
+from pydantic import BaseModel, ConfigDict, HttpUrl, model_validator
 
 
 # =============================================================================
@@ -96,6 +96,9 @@ class IOCType(str, Enum):
 class GitHubActor(BaseModel):
     """GitHub user/actor."""
 
+    # Frozen so one instance can be shared by many evidence objects
+    model_config = ConfigDict(frozen=True)
+
     login: str
     id: int | None = None
 
@@ -103,6 +106,8 @@ class GitHubActor(BaseModel):
 class GitHubRepository(BaseModel):
     """GitHub repository."""
 
+    model_config = ConfigDict(frozen=True)
+
     owner: str
     name: str
     full_name: str
@@ -111,6 +116,8 @@ class GitHubRepository(BaseModel):
 class VerificationInfo(BaseModel):
     """How to verify this evidence."""
 
+    model_config = ConfigDict(frozen=True)
+
     source: EvidenceSource
     url: HttpUrl | None = None
     bigquery_table: str | None = None
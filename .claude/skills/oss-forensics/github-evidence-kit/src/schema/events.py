@@ -6,7 +6,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .common import (
     EvidenceSource,
@@ -31,6 +31,9 @@ from .common import (
 class Event(BaseModel):
     """Something that happened."""
 
+    # Immutable: EvidenceStore indexes entries by their fields
+    model_config = ConfigDict(frozen=True)
+
     evidence_id: str
     when: datetime
     who: GitHubActor
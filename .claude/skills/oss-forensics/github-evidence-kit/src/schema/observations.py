@@ -6,7 +6,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 from .common import (
     EvidenceSource,
@@ -31,6 +31,9 @@ from .common import (
 class Observation(BaseModel):
     """Something we observed."""
 
+    # Immutable: EvidenceStore indexes entries by their fields
+    model_config = ConfigDict(frozen=True)
+
     evidence_id: str
 
     # Original event (if known)
@@ -6,14 +6,88 @@ Provides save/load/query functionality for evidence objects.
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import os
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import count
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Callable, Iterator, Sequence
+from typing import Callable, Iterable, Iterator
 
-from .schema import AnyEvidence, AnyEvent, AnyObservation
+from .helpers import json_loads
+from .schema import AnyEvidence, AnyEvent, AnyObservation, Event, Observation
 from .schema.common import EvidenceSource
 
+TimestampGetter = Callable[[AnyEvidence], datetime | None]
+
+# Primary-timestamp accessor per evidence class, resolved on first sight
+_TIMESTAMP_GETTERS: dict[type, TimestampGetter] = {}
+
+
+def _resolve_timestamp_getter(cls: type) -> TimestampGetter:
+    """Inspect an evidence class once and cache how to read its timestamp."""
+    fields = getattr(cls, "model_fields", {})
+    getter: TimestampGetter
+    if "when" in fields:
+        getter = attrgetter("when")
+    elif "original_when" in fields:
+        getter = lambda e: e.original_when or e.observed_when
+    elif "observed_when" in fields:
+        getter = attrgetter("observed_when")
+    else:
+        getter = lambda e: None
+    _TIMESTAMP_GETTERS[cls] = getter
+    return getter
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> frozenset[str]:
+    return frozenset(getattr(cls, "model_fields", ()))
+
+
+def has_field(evidence: AnyEvidence, name: str) -> bool:
+    """Whether the evidence model declares ``name`` as a field.
+
+    A cached per-class set lookup; prefer it over ``hasattr`` in filter
+    predicates, which probes the attribute and catches AttributeError.
+    """
+    return name in _field_names(type(evidence))
+
+
+# Attribute value -> IDs holding it, as insertion-ordered dicts used as sets
+Index = dict[str, dict[str, None]]
+
+
+def _index_add(index: Index, key: str, evidence_id: str) -> None:
+    index.setdefault(key, {})[evidence_id] = None
+
+
+def _index_discard(index: Index, key: str, evidence_id: str) -> None:
+    """Remove an ID from an index, dropping the key when it has no IDs left."""
+    ids = index[key]
+    del ids[evidence_id]
+    if not ids:
+        del index[key]
+
+
+def _get_timestamp(evidence: AnyEvidence) -> datetime | None:
+    """Get the primary timestamp for an evidence object."""
+    cls = type(evidence)
+    getter = _TIMESTAMP_GETTERS.get(cls) or _resolve_timestamp_getter(cls)
+    return getter(evidence)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _time_key(ts: datetime) -> int:
+    """Integer sort key for a timestamp; naive datetimes are taken as UTC."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return (ts - _EPOCH) // _MICROSECOND
+
 
 class EvidenceStore:
     """
@@ -28,19 +102,106 @@ class EvidenceStore:
         commits = store.filter(observation_type="commit")
     """
 
-    def __init__(self, evidence: Sequence[AnyEvidence] | None = None):
-        self._evidence: list[AnyEvidence] = list(evidence) if evidence else []
-        self._by_id: dict[str, AnyEvidence] = {e.evidence_id: e for e in self._evidence}
+    def __init__(self, evidence: Iterable[AnyEvidence] | None = None):
+        # Insertion-ordered; the single source of truth for store contents
+        self._by_id: dict[str, AnyEvidence] = {}
+        # Kind views, kept in insertion order and updated on every mutation
+        self._events: dict[str, AnyEvent] = {}
+        self._observations: dict[str, AnyObservation] = {}
+        # Filter indexes; their sizes double as the summary counts
+        self._by_event_type: Index = {}
+        self._by_observation_type: Index = {}
+        self._by_source: Index = {}
+        self._by_repo: Index = {}
+        # Date index: timestamp key per ID, plus parallel lists sorted by key
+        # for bisecting after/before ranges. Single adds keep the lists sorted;
+        # batch adds mark them stale and they are re-sorted on the next date
+        # query. Evidence without a timestamp matches any range.
+        self._time_keys: dict[str, int] = {}
+        self._times: list[int] = []
+        self._time_ids: list[str] = []
+        self._times_stale = False
+        self._untimed: dict[str, None] = {}
+        # Insertion sequence, to put date-range hits back in store order
+        self._position: dict[str, int] = {}
+        self._counter = count()
+        if evidence:
+            self.add_all(evidence)
+
+    def _index(self, evidence: AnyEvidence) -> None:
+        """Register evidence in the kind views and filter indexes."""
+        eid = evidence.evidence_id
+        if isinstance(evidence, Event):
+            self._events[eid] = evidence
+            _index_add(self._by_event_type, evidence.event_type, eid)
+        elif isinstance(evidence, Observation):
+            self._observations[eid] = evidence
+            _index_add(self._by_observation_type, evidence.observation_type, eid)
+        _index_add(self._by_source, evidence.verification.source.value, eid)
+        if evidence.repository:
+            _index_add(self._by_repo, evidence.repository.full_name, eid)
+        self._position[eid] = next(self._counter)
+        ts = _get_timestamp(evidence)
+        if ts is None:
+            self._untimed[eid] = None
+        else:
+            key = self._time_keys[eid] = _time_key(ts)
+            if not self._times_stale:
+                i = bisect_right(self._times, key)
+                self._times.insert(i, key)
+                self._time_ids.insert(i, eid)
+
+    def _unindex(self, evidence: AnyEvidence) -> None:
+        """Drop evidence from the kind views and filter indexes."""
+        eid = evidence.evidence_id
+        if isinstance(evidence, Event):
+            del self._events[eid]
+            _index_discard(self._by_event_type, evidence.event_type, eid)
+        elif isinstance(evidence, Observation):
+            del self._observations[eid]
+            _index_discard(self._by_observation_type, evidence.observation_type, eid)
+        _index_discard(self._by_source, evidence.verification.source.value, eid)
+        if evidence.repository:
+            _index_discard(self._by_repo, evidence.repository.full_name, eid)
+        del self._position[eid]
+        if eid in self._untimed:
+            del self._untimed[eid]
+        else:
+            key = self._time_keys.pop(eid)
+            if not self._times_stale:
+                i = self._time_ids.index(eid, bisect_left(self._times, key), bisect_right(self._times, key))
+                del self._times[i]
+                del self._time_ids[i]
+
+    def _sorted_times(self) -> tuple[list[int], list[str]]:
+        """The date index as sorted (keys, IDs) lists, re-sorting if stale."""
+        if self._times_stale:
+            pairs = sorted(self._time_keys.items(), key=itemgetter(1))
+            self._time_ids = [eid for eid, _ in pairs]
+            self._times = [key for _, key in pairs]
+            self._times_stale = False
+        return self._times, self._time_ids
 
     def add(self, evidence: AnyEvidence) -> None:
-        """Add evidence to the store (replaces existing with same ID)."""
-        if evidence.evidence_id in self._by_id:
-            self._evidence = [e for e in self._evidence if e.evidence_id != evidence.evidence_id]
-        self._evidence.append(evidence)
+        """Add evidence to the store.
+
+        Evidence with an existing ID replaces the old entry and moves to the
+        end of the iteration order, as if newly inserted.
+        """
+        existing = self._by_id.pop(evidence.evidence_id, None)
+        if existing is not None:
+            self._unindex(existing)
         self._by_id[evidence.evidence_id] = evidence
+        self._index(evidence)
 
-    def add_all(self, evidence_list: Sequence[AnyEvidence]) -> None:
+    def add_all(self, evidence_list: Iterable[AnyEvidence]) -> None:
         """Add multiple evidence objects to the store."""
+        evidence_list = list(evidence_list)
+        if len(evidence_list) > 1:
+            # A sorted insert per item is O(n) each; sort once when next queried
+            self._times_stale = True
+            self._times.clear()
+            self._time_ids.clear()
         for e in evidence_list:
             self.add(e)
 
@@ -50,22 +211,33 @@ class EvidenceStore:
 
     def remove(self, evidence_id: str) -> bool:
         """Remove evidence by ID. Returns True if removed."""
-        if evidence_id in self._by_id:
-            del self._by_id[evidence_id]
-            self._evidence = [e for e in self._evidence if e.evidence_id != evidence_id]
-            return True
-        return False
+        evidence = self._by_id.pop(evidence_id, None)
+        if evidence is None:
+            return False
+        self._unindex(evidence)
+        return True
 
     def clear(self) -> None:
         """Remove all evidence from the store."""
-        self._evidence.clear()
         self._by_id.clear()
+        self._events.clear()
+        self._observations.clear()
+        self._by_event_type.clear()
+        self._by_observation_type.clear()
+        self._by_source.clear()
+        self._by_repo.clear()
+        self._time_keys.clear()
+        self._times.clear()
+        self._time_ids.clear()
+        self._times_stale = False
+        self._untimed.clear()
+        self._position.clear()
 
     def __len__(self) -> int:
-        return len(self._evidence)
+        return len(self._by_id)
 
     def __iter__(self) -> Iterator[AnyEvidence]:
-        return iter(self._evidence)
+        return iter(self._by_id.values())
 
     def __contains__(self, evidence_id: str) -> bool:
         return evidence_id in self._by_id
@@ -73,12 +245,12 @@ class EvidenceStore:
     @property
     def events(self) -> list[AnyEvent]:
         """Get all events."""
-        return [e for e in self._evidence if hasattr(e, "event_type")]
+        return list(self._events.values())
 
     @property
     def observations(self) -> list[AnyObservation]:
         """Get all observations."""
-        return [e for e in self._evidence if hasattr(e, "observation_type")]
+        return list(self._observations.values())
 
     def filter(
         self,
@@ -91,65 +263,102 @@ class EvidenceStore:
         before: datetime | None = None,
         predicate: Callable[[AnyEvidence], bool] | None = None,
     ) -> list[AnyEvidence]:
-        """Filter evidence by various criteria."""
-
-        def matches(e: AnyEvidence) -> bool:
-            if event_type and getattr(e, "event_type", None) != event_type:
-                return False
-            if observation_type and getattr(e, "observation_type", None) != observation_type:
-                return False
-            if source:
-                src = source if isinstance(source, EvidenceSource) else EvidenceSource(source)
-                if e.verification.source != src:
-                    return False
-            if repo:
-                repo_obj = getattr(e, "repository", None)
-                if not repo_obj or repo_obj.full_name != repo:
-                    return False
-            ts = self._get_timestamp(e)
-            if ts:
-                if after and ts < after:
-                    return False
-                if before and ts > before:
-                    return False
-            if predicate and not predicate(e):
-                return False
-            return True
-
-        return [e for e in self._evidence if matches(e)]
-
-    def _get_timestamp(self, evidence: AnyEvidence) -> datetime | None:
-        """Get the primary timestamp for an evidence object."""
-        if hasattr(evidence, "when"):
-            return evidence.when
-        if hasattr(evidence, "original_when") and evidence.original_when:
-            return evidence.original_when
-        if hasattr(evidence, "observed_when"):
-            return evidence.observed_when
-        return None
-
-    def to_json(self, indent: int = 2) -> str:
+        """Filter evidence by various criteria.
+
+        Type, source, repo and date criteria are answered from indexes: only
+        the IDs in the smallest matching index are visited, in store order.
+        Dates are compared as UTC, with naive datetimes taken as UTC.
+        Predicates testing for a field should use ``has_field(e, name)``.
+        """
+        # Falsy criteria (None or "") mean "no filter"
+        wanted: list[dict[str, None]] = []
+        if event_type:
+            wanted.append(self._by_event_type.get(event_type, {}))
+        if observation_type:
+            wanted.append(self._by_observation_type.get(observation_type, {}))
+        if source:
+            src = source if isinstance(source, EvidenceSource) else EvidenceSource(source)
+            wanted.append(self._by_source.get(src.value, {}))
+        if repo:
+            wanted.append(self._by_repo.get(repo, {}))
+        in_range: dict[str, None] | None = None
+        if after or before:
+            times, time_ids = self._sorted_times()
+            lo = bisect_left(times, _time_key(after)) if after else 0
+            hi = bisect_right(times, _time_key(before)) if before else len(times)
+            in_range = dict.fromkeys(time_ids[lo:hi])
+            in_range.update(self._untimed)
+            wanted.append(in_range)
+
+        if wanted:
+            wanted.sort(key=len)
+            smallest, rest = wanted[0], wanted[1:]
+            ids = [eid for eid in smallest if all(eid in other for other in rest)]
+            if smallest is in_range:
+                # Date hits come out in timestamp order
+                ids.sort(key=self._position.__getitem__)
+            candidates = [self._by_id[eid] for eid in ids]
+        else:
+            candidates = list(self._by_id.values())
+
+        if predicate:
+            return [e for e in candidates if predicate(e)]
+        return candidates
+
+    def iter_json(self, indent: int | None = 2) -> Iterator[str]:
+        """Serialize store to JSON one evidence item at a time.
+
+        Yields chunks that concatenate to a JSON array of all items, without
+        holding every item in memory. Items are encoded by pydantic's
+        ``model_dump_json``, skipping the intermediate dict. Indented output
+        is laid out like ``json.dumps(..., indent=indent)``; ``indent=None``
+        is compact.
+        """
+        if not self._by_id:
+            yield "[]"
+            return
+
+        pad = "\n" + " " * indent if indent is not None else ""
+        yield "["
+        for i, e in enumerate(self._by_id.values()):
+            item = e.model_dump_json(indent=indent)
+            yield ("," if i else "") + pad + item.replace("\n", pad)
+        yield "\n]" if indent is not None else "]"
+
+    def to_json(self, indent: int | None = 2) -> str:
         """Serialize store to JSON string."""
-        data = [e.model_dump(mode="json") for e in self._evidence]
-        return json.dumps(data, indent=indent, default=str)
+        return "".join(self.iter_json(indent))
 
     def save(self, path: str | Path) -> None:
-        """Save store to JSON file."""
+        """Save store to JSON file, streaming items to disk.
+
+        Items are written to a sibling temp file that then replaces ``path``,
+        so an interrupted save never leaves a truncated evidence file behind.
+        """
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(self.to_json())
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            # Non-ASCII is written unescaped, so don't depend on the locale encoding
+            with tmp.open("w", encoding="utf-8") as f:
+                f.writelines(self.iter_json())
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
 
     @classmethod
-    def from_json(cls, json_str: str) -> "EvidenceStore":
+    def from_json(cls, json_str: str | bytes) -> "EvidenceStore":
         """Create store from JSON string."""
         from . import load_evidence_from_json
-        data = json.loads(json_str)
+        data = json_loads(json_str)
         return cls([load_evidence_from_json(item) for item in data])
 
     @classmethod
     def load(cls, path: str | Path) -> "EvidenceStore":
         """Load store from JSON file."""
-        return cls.from_json(Path(path).read_text())
+        # Bytes skip a decode step; both json decoders accept UTF-8 input
+        return cls.from_json(Path(path).read_bytes())
 
     def merge(self, other: "EvidenceStore") -> None:
         """Merge another store into this one."""
@@ -157,28 +366,16 @@ class EvidenceStore:
 
     def summary(self) -> dict:
         """Get a summary of the store contents."""
-        event_counts: dict[str, int] = {}
-        obs_counts: dict[str, int] = {}
-        source_counts: dict[str, int] = {}
-
-        for e in self._evidence:
-            if hasattr(e, "event_type"):
-                event_counts[e.event_type] = event_counts.get(e.event_type, 0) + 1
-            if hasattr(e, "observation_type"):
-                obs_counts[e.observation_type] = obs_counts.get(e.observation_type, 0) + 1
-            src = e.verification.source.value
-            source_counts[src] = source_counts.get(src, 0) + 1
-
         return {
-            "total": len(self._evidence),
-            "events": event_counts,
-            "observations": obs_counts,
-            "by_source": source_counts,
+            "total": len(self._by_id),
+            "events": {k: len(ids) for k, ids in self._by_event_type.items()},
+            "observations": {k: len(ids) for k, ids in self._by_observation_type.items()},
+            "by_source": {k: len(ids) for k, ids in self._by_source.items()},
         }
 
     def verify_all(self) -> tuple[bool, list[str]]:
         """Verify all evidence against their original sources."""
         from .verifiers.consistency import ConsistencyVerifier
         verifier = ConsistencyVerifier()
-        result = verifier.verify_all(self._evidence)
+        result = verifier.verify_all(list(self._by_id.values()))
         return result.is_valid, result.errors
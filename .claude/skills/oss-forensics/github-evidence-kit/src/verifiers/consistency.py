@@ -3,18 +3,55 @@ Verification Service - Verify evidence against original sources.
 """
 from __future__ import annotations
 
-from typing import Callable, Sequence
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Sequence
 
 from ..clients.gharchive import GHArchiveClient
 from ..clients.github import GitHubClient
 from ..schema.common import EvidenceSource, VerificationResult
 from ..schema.events import Event
-from ..schema.observations import Observation
+from ..schema.observations import IOC, Observation
+
+
+@lru_cache(maxsize=None)
+def _base_verifier(evidence_cls: type) -> str | None:
+    """Resolve the top-level verifier method for an evidence class (once per class)."""
+    if issubclass(evidence_cls, Event):
+        return "_verify_event"
+    if issubclass(evidence_cls, Observation):
+        return "_verify_observation"
+    return None
 
 
 class ConsistencyVerifier:
     """Verifies evidence against external sources."""
 
+    # Dispatch tables map keys to method names; built once at class creation.
+    _EVENT_VERIFIERS: dict[EvidenceSource, str] = {
+        EvidenceSource.GHARCHIVE: "_verify_gharchive_event",
+        EvidenceSource.GIT: "_verify_local_git",
+    }
+
+    _OBSERVATION_VERIFIERS: dict[EvidenceSource, str] = {
+        EvidenceSource.GITHUB: "_verify_github_observation",
+        EvidenceSource.GHARCHIVE: "_verify_gharchive_observation",
+        EvidenceSource.WAYBACK: "_verify_url_accessible",
+        EvidenceSource.SECURITY_VENDOR: "_verify_security_vendor",
+        EvidenceSource.GIT: "_verify_local_git",
+    }
+
+    _GITHUB_VERIFIERS: dict[str, str] = {
+        "commit": "_verify_commit",
+        "issue": "_verify_issue",
+        "file": "_verify_file",
+        "branch": "_verify_branch",
+        "tag": "_verify_tag",
+        "release": "_verify_release",
+        "fork": "_verify_url_accessible",
+    }
+
     def __init__(
         self,
         github_client: GitHubClient | None = None,
@@ -22,23 +59,45 @@ class ConsistencyVerifier:
     ):
         self.github_client = github_client or GitHubClient()
         self.gharchive_client = gharchive_client or GHArchiveClient()
+        # Per-run response memo; only set while verify_all is running. Holds
+        # one Future per request so concurrent workers wait on a single fetch.
+        self._fetch_memo: dict[tuple, Future] | None = None
+        self._fetch_lock = threading.Lock()
 
     def verify(self, evidence: Event | Observation) -> VerificationResult:
         """Verify evidence against its source."""
-        if isinstance(evidence, Event):
-            return self._verify_event(evidence)
-        elif isinstance(evidence, Observation):
-            return self._verify_observation(evidence)
-        else:
+        method = _base_verifier(type(evidence))
+        if method is None:
             return VerificationResult(is_valid=False, errors=["Unknown evidence type"])
+        return getattr(self, method)(evidence)
 
-    def verify_all(self, evidence_list: Sequence[Event | Observation]) -> VerificationResult:
-        """Verify a list of evidence items. Aggregates all errors."""
+    def verify_all(
+        self,
+        evidence_list: Sequence[Event | Observation],
+        max_workers: int = 1,
+    ) -> VerificationResult:
+        """Verify a list of evidence items. Aggregates all errors.
+
+        Items are checked one at a time by default: the GitHub API allows 60
+        unauthenticated requests an hour and discourages concurrent requests.
+        Pass ``max_workers`` > 1 to opt in to checking items on that many
+        threads. Errors are reported in input order.
+        """
         all_errors: list[str] = []
         all_valid = True
 
-        for evidence in evidence_list:
-            result = self.verify(evidence)
+        # Evidence often references the same upstream commit/issue; fetch each once
+        self._fetch_memo = {}
+        try:
+            if max_workers > 1 and len(evidence_list) > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    results = list(pool.map(self.verify, evidence_list))
+            else:
+                results = [self.verify(evidence) for evidence in evidence_list]
+        finally:
+            self._fetch_memo = None
+
+        for evidence, result in zip(evidence_list, results):
             if not result.is_valid:
                 all_valid = False
                 evidence_id = getattr(evidence, "evidence_id", "unknown")
@@ -49,30 +108,22 @@ class ConsistencyVerifier:
     def _verify_event(self, event: Event) -> VerificationResult:
         """Verify an event against the original source."""
         source = event.verification.source
-
-        if source == EvidenceSource.GHARCHIVE:
-            return self._verify_gharchive_event(event)
-        if source == EvidenceSource.GIT:
-            return VerificationResult(is_valid=True, errors=["Local git verification not supported"])
-        
-        return VerificationResult(is_valid=False, errors=[f"Unknown verification source for event: {source}"])
+        method = self._EVENT_VERIFIERS.get(source)
+        if not method:
+            return VerificationResult(is_valid=False, errors=[f"Unknown verification source for event: {source}"])
+        return getattr(self, method)(event)
 
     def _verify_observation(self, observation: Observation) -> VerificationResult:
         """Verify an observation against the original source."""
         source = observation.verification.source
-
-        verifiers: dict[EvidenceSource, Callable[[Observation], VerificationResult]] = {
-            EvidenceSource.GITHUB: self._verify_github_observation,
-            EvidenceSource.GHARCHIVE: self._verify_gharchive_observation,
-            EvidenceSource.WAYBACK: self._verify_url_accessible,
-            EvidenceSource.SECURITY_VENDOR: self._verify_security_vendor,
-            EvidenceSource.GIT: lambda o: VerificationResult(is_valid=True, errors=["Local git verification not supported"]),
-        }
-
-        verifier = verifiers.get(source)
-        if not verifier:
+        method = self._OBSERVATION_VERIFIERS.get(source)
+        if not method:
             return VerificationResult(is_valid=False, errors=[f"Unknown verification source: {source}"])
-        return verifier(observation)
+        return getattr(self, method)(observation)
+
+    def _verify_local_git(self, evidence: Event | Observation) -> VerificationResult:
+        """Local git evidence cannot be re-verified against a remote source."""
+        return VerificationResult(is_valid=True, errors=["Local git verification not supported"])
 
     # =========================================================================
     # GITHUB API VERIFICATION
@@ -81,18 +132,7 @@ class ConsistencyVerifier:
     def _verify_github_observation(self, observation: Observation) -> VerificationResult:
         """Verify observation against GitHub API."""
         obs_type = getattr(observation, "observation_type", None)
-
-        verifiers: dict[str, Callable[[Observation], VerificationResult]] = {
-            "commit": self._verify_commit,
-            "issue": self._verify_issue,
-            "file": self._verify_file,
-            "branch": self._verify_branch,
-            "tag": self._verify_tag,
-            "release": self._verify_release,
-            "fork": self._verify_url_accessible,
-        }
-
-        verifier = verifiers.get(obs_type, self._verify_url_accessible)
+        verifier = getattr(self, self._GITHUB_VERIFIERS.get(obs_type, "_verify_url_accessible"))
 
         try:
             return verifier(observation)
@@ -101,6 +141,28 @@ class ConsistencyVerifier:
                 return VerificationResult(is_valid=True, errors=[])  # Expected - item is marked as deleted
             return VerificationResult(is_valid=False, errors=[f"Verification failed: {e}"])
 
+    def _fetch(self, fetch: Callable[..., dict[str, Any]], *args: Any) -> dict[str, Any]:
+        """Call a client method, reusing its response within a verify_all run.
+
+        Failures are reused too: a deleted commit's 404 is fetched once, not
+        once per observation referencing it.
+        """
+        memo = self._fetch_memo
+        if memo is None:
+            return fetch(*args)
+        key = (fetch, *args)
+        with self._fetch_lock:
+            future = memo.get(key)
+            claimed = future is None
+            if claimed:
+                future = memo[key] = Future()
+        if claimed:
+            try:
+                future.set_result(fetch(*args))
+            except BaseException as e:
+                future.set_exception(e)
+        return future.result()
+
     def _get_repo_info(self, obs: Observation) -> tuple[str, str] | None:
         """Extract (owner, name) from observation. Returns None if missing."""
         repo = obs.repository
@@ -117,7 +179,7 @@ class ConsistencyVerifier:
             return VerificationResult(is_valid=False, errors=["No SHA specified"])
 
         errors: list[str] = []
-        data = self.github_client.get_commit(*repo_info, sha)
+        data = self._fetch(self.github_client.get_commit, *repo_info, sha)
         commit = data.get("commit", {})
 
         if data.get("sha") != sha:
@@ -145,7 +207,8 @@ class ConsistencyVerifier:
 
         errors: list[str] = []
         is_pr = getattr(obs, "is_pull_request", False)
-        data = self.github_client.get_pull_request(*repo_info, number) if is_pr else self.github_client.get_issue(*repo_info, number)
+        fetch = self.github_client.get_pull_request if is_pr else self.github_client.get_issue
+        data = self._fetch(fetch, *repo_info, number)
 
         if data.get("number") != number:
             errors.append(f"Number mismatch: expected {number}, got {data.get('number')}")
@@ -174,7 +237,7 @@ class ConsistencyVerifier:
             return VerificationResult(is_valid=False, errors=["No file path specified"])
 
         ref = getattr(obs, "branch", None) or "HEAD"
-        data = self.github_client.get_file(*repo_info, file_path, ref)
+        data = self._fetch(self.github_client.get_file, *repo_info, file_path, ref)
 
         if hasattr(obs, "content_hash") and obs.content_hash:
             raw = data.get("content", "")
@@ -194,7 +257,7 @@ class ConsistencyVerifier:
         if not branch_name:
             return VerificationResult(is_valid=False, errors=["No branch name specified"])
 
-        data = self.github_client.get_branch(*repo_info, branch_name)
+        data = self._fetch(self.github_client.get_branch, *repo_info, branch_name)
 
         if hasattr(obs, "head_sha") and obs.head_sha:
             actual = data.get("commit", {}).get("sha")
@@ -213,7 +276,7 @@ class ConsistencyVerifier:
         if not tag_name:
             return VerificationResult(is_valid=False, errors=["No tag name specified"])
 
-        data = self.github_client.get_tag(*repo_info, tag_name)
+        data = self._fetch(self.github_client.get_tag, *repo_info, tag_name)
 
         if hasattr(obs, "target_sha") and obs.target_sha:
             actual = data.get("object", {}).get("sha")
@@ -232,7 +295,7 @@ class ConsistencyVerifier:
         if not tag_name:
             return VerificationResult(is_valid=False, errors=["No tag name specified"])
 
-        data = self.github_client.get_release(*repo_info, tag_name)
+        data = self._fetch(self.github_client.get_release, *repo_info, tag_name)
 
         if data.get("tag_name") != tag_name:
             return VerificationResult(is_valid=False, errors=["Tag name mismatch"])
@@ -270,8 +333,8 @@ class ConsistencyVerifier:
             resp.raise_for_status()
 
             # For IOCs, verify value appears in content
-            if getattr(obs, "observation_type", None) == "ioc":
-                value = getattr(obs, "value", None)
+            if isinstance(obs, IOC):
+                value = obs.value
                 if value and value.lower() not in resp.text.lower():
                     return VerificationResult(is_valid=False, errors=[f"IOC value '{value[:50]}' not found in source"])
 
@@ -37,25 +37,29 @@ def load_fixture(name: str) -> dict | list:
 # =============================================================================
 
 
-@pytest.fixture
+# The GH Archive rows are only read by the parsers, so they are loaded and
+# filtered once per session and shared. Do not mutate them in tests.
+
+
+@pytest.fixture(scope="session")
 def gharchive_events() -> list[dict]:
     """All GH Archive fixture data from July 13, 2025."""
     return load_fixture("gharchive_july13_2025.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gharchive_push_events(gharchive_events) -> list[dict]:
     """Only PushEvent from GH Archive fixtures."""
     return [e for e in gharchive_events if e["type"] == "PushEvent"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gharchive_issue_events(gharchive_events) -> list[dict]:
     """Only IssuesEvent from GH Archive fixtures."""
     return [e for e in gharchive_events if e["type"] == "IssuesEvent"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gharchive_create_events(gharchive_events) -> list[dict]:
     """Only CreateEvent from GH Archive fixtures."""
     return [e for e in gharchive_events if e["type"] == "CreateEvent"]
@@ -66,9 +70,10 @@ def gharchive_create_events(gharchive_events) -> list[dict]:
 # =============================================================================
 
 
-@pytest.fixture
-def sample_push_event_data() -> dict:
-    """Sample push event data for testing."""
+# Plain builders, so the session-scoped loaded fixtures below share the data
+
+
+def _push_event_data() -> dict:
     return {
         "event_type": "push",
         "evidence_id": "push-test-001",
@@ -94,8 +99,12 @@ def sample_push_event_data() -> dict:
 
 
 @pytest.fixture
-def sample_commit_observation_data() -> dict:
-    """Sample commit observation data for testing."""
+def sample_push_event_data() -> dict:
+    """Sample push event data for testing."""
+    return _push_event_data()
+
+
+def _commit_observation_data() -> dict:
     return {
         "observation_type": "commit",
         "evidence_id": "commit-test-001",
@@ -132,8 +141,12 @@ def sample_commit_observation_data() -> dict:
 
 
 @pytest.fixture
-def sample_ioc_data() -> dict:
-    """Sample IOC data for testing."""
+def sample_commit_observation_data() -> dict:
+    """Sample commit observation data for testing."""
+    return _commit_observation_data()
+
+
+def _ioc_data() -> dict:
     return {
         "observation_type": "ioc",
         "evidence_id": "ioc-test-001",
@@ -152,8 +165,12 @@ def sample_ioc_data() -> dict:
 
 
 @pytest.fixture
-def sample_issue_event_data() -> dict:
-    """Sample issue event data for testing."""
+def sample_ioc_data() -> dict:
+    """Sample IOC data for testing."""
+    return _ioc_data()
+
+
+def _issue_event_data() -> dict:
     return {
         "event_type": "issue",
         "evidence_id": "issue-test-001",
@@ -176,33 +193,63 @@ def sample_issue_event_data() -> dict:
     }
 
 
+@pytest.fixture
+def sample_issue_event_data() -> dict:
+    """Sample issue event data for testing."""
+    return _issue_event_data()
+
+
 # =============================================================================
 # LOADED EVIDENCE FIXTURES
 # =============================================================================
 
 
+# Validated once per session; tests get a shallow model_copy(), which is
+# several times cheaper than re-validating and isolates top-level field edits.
+
+
+@pytest.fixture(scope="session")
+def _loaded_push_event():
+    return load_evidence_from_json(_push_event_data())
+
+
 @pytest.fixture
-def sample_push_event(sample_push_event_data):
+def sample_push_event(_loaded_push_event):
     """Sample push event loaded into evidence object."""
-    return load_evidence_from_json(sample_push_event_data)
+    return _loaded_push_event.model_copy()
+
+
+@pytest.fixture(scope="session")
+def _loaded_commit_observation():
+    return load_evidence_from_json(_commit_observation_data())
 
 
 @pytest.fixture
-def sample_commit_observation(sample_commit_observation_data):
+def sample_commit_observation(_loaded_commit_observation):
     """Sample commit observation loaded into evidence object."""
-    return load_evidence_from_json(sample_commit_observation_data)
+    return _loaded_commit_observation.model_copy()
+
+
+@pytest.fixture(scope="session")
+def _loaded_ioc():
+    return load_evidence_from_json(_ioc_data())
 
 
 @pytest.fixture
-def sample_ioc(sample_ioc_data):
+def sample_ioc(_loaded_ioc):
     """Sample IOC loaded into evidence object."""
-    return load_evidence_from_json(sample_ioc_data)
+    return _loaded_ioc.model_copy()
+
+
+@pytest.fixture(scope="session")
+def _loaded_issue_event():
+    return load_evidence_from_json(_issue_event_data())
 
 
 @pytest.fixture
-def sample_issue_event(sample_issue_event_data):
+def sample_issue_event(_loaded_issue_event):
     """Sample issue event loaded into evidence object."""
-    return load_evidence_from_json(sample_issue_event_data)
+    return _loaded_issue_event.model_copy()
 
 
 # =============================================================================
@@ -0,0 +1,36 @@
+-- Cached slice of GH Archive for the Amazon Q integration tests.
+--
+-- The tests only look at two minutes of one repository, but every query
+-- against githubarchive.day.20250713 scans the whole day partition. Run this
+-- once in your own project, then point the tests at the result:
+--
+--   bq query --use_legacy_sql=false < tests/fixtures/bq_cache.sql
+--   export GHARCHIVE_TEST_TABLE=<project>.raptor_test.gharchive_attack_minute
+--
+-- A plain table is used rather than a materialized view: the source is a
+-- public dataset outside your project and the slice never changes, so there
+-- is nothing to refresh.
+
+CREATE SCHEMA IF NOT EXISTS raptor_test;
+
+CREATE TABLE IF NOT EXISTS raptor_test.gharchive_attack_minute AS
+SELECT *
+FROM `githubarchive.day.20250713`
+WHERE repo.name = 'aws/aws-toolkit-vscode'
+  AND FORMAT_TIMESTAMP('%Y%m%d%H%M', created_at) IN ('202507130752', '202507132037');
+
+-- Alternative for ad-hoc queries beyond those two minutes: a copy of the
+-- whole day, partitioned by day and clustered by event type. The client adds
+-- DATE(created_at) = @day for table overrides, which prunes to one partition,
+-- and the event type filter prunes to the matching blocks. repo.name is a
+-- STRUCT field, and BigQuery only clusters on top-level columns, so it cannot be
+-- a clustering key.
+--
+--   export GHARCHIVE_TEST_TABLE=<project>.raptor_test.gharchive_clustered
+
+CREATE TABLE IF NOT EXISTS raptor_test.gharchive_clustered
+PARTITION BY DATE(created_at)
+CLUSTER BY type
+AS
+SELECT *
+FROM `githubarchive.day.20250713`;
@@ -7,7 +7,11 @@ since the actual API calls require network access (covered in integration tests)
 """
 
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -56,6 +60,33 @@ class TestGitHubClient:
         assert hasattr(client, "get_forks")
         assert hasattr(client, "get_repo")
 
+    def test_cache_revalidates_with_etag(self, tmp_path):
+        """Cached responses are revalidated and reused on 304 Not Modified."""
+        client = GitHubClient(cache_path=tmp_path / "gh_api.sqlite")
+        client._session = Mock()
+        client._session.get.side_effect = [
+            Mock(status_code=200, headers={"ETag": '"abc"'}, text='{"sha": "678851b"}', json=lambda: {"sha": "678851b"}),
+            Mock(status_code=304, headers={}),
+        ]
+
+        first = client.get_commit("aws", "aws-toolkit-vscode", "678851b")
+        second = client.get_commit("aws", "aws-toolkit-vscode", "678851b")
+
+        assert first == second == {"sha": "678851b"}
+        assert client._session.get.call_args_list[0].kwargs["headers"] is None
+        assert client._session.get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+    def test_no_cache_by_default(self):
+        """Without cache_path, requests carry no conditional headers."""
+        client = GitHubClient()
+        client._session = Mock()
+
+        client.get_file("owner", "repo", "README.md")
+
+        client._session.get.assert_called_once_with(
+            "https://api.github.com/repos/owner/repo/contents/README.md", params={"ref": "HEAD"}
+        )
+
 
 # =============================================================================
 # WAYBACK CLIENT TESTS
@@ -109,6 +140,55 @@ class TestGHArchiveClient:
         client = GHArchiveClient()
         assert hasattr(client, "query_events")
 
+    def test_event_types_share_one_query(self):
+        """Multiple event types are sent as one array parameter in one query."""
+        client = GHArchiveClient()
+        client._client = Mock()
+        client._client.query.return_value = []
+
+        client.query_events(
+            repo="owner/repo",
+            event_types=["IssuesEvent", "ForkEvent"],
+            from_date="202507130752",
+        )
+
+        client._client.query.assert_called_once()
+        query = client._client.query.call_args.args[0]
+        params = {p.name: p for p in client._client.query.call_args.kwargs["job_config"].query_parameters}
+        assert "type IN UNNEST(@event_types)" in query
+        assert params["event_types"].values == ["IssuesEvent", "ForkEvent"]
+
+    def test_iter_events_submits_eagerly_and_converts_lazily(self):
+        """The query runs on call; rows become dicts only as they are consumed."""
+        client = GHArchiveClient()
+        client._client = Mock()
+        client._client.query.return_value = iter([{"type": "PushEvent"}, {"type": "IssuesEvent"}])
+
+        rows = client.iter_events(repo="owner/repo", from_date="202507130752")
+
+        client._client.query.assert_called_once()
+        assert next(rows) == {"type": "PushEvent"}
+        assert list(rows) == [{"type": "IssuesEvent"}]
+
+    def test_table_override_filters_by_day(self):
+        """A table override replaces the day table and adds a date filter."""
+        client = GHArchiveClient(table="my-project.raptor_test.gharchive_attack_minute")
+        client._client = Mock()
+        client._client.query.return_value = []
+
+        client.query_events(repo="owner/repo", from_date="202507130752")
+
+        query = client._client.query.call_args.args[0]
+        params = {p.name: p for p in client._client.query.call_args.kwargs["job_config"].query_parameters}
+        assert "FROM `my-project.raptor_test.gharchive_attack_minute`" in query
+        assert "githubarchive.day" not in query
+        assert params["day"].value == date(2025, 7, 13)
+
+    def test_rejects_invalid_table_override(self):
+        """Table ids are interpolated into SQL, so malformed ids are refused."""
+        with pytest.raises(ValueError, match="Invalid BigQuery table id"):
+            GHArchiveClient(table="x`; DROP TABLE y; --")
+
 
 # =============================================================================
 # GIT CLIENT TESTS
@@ -138,6 +218,7 @@ class TestGitClient:
         client = GitClient()
         assert hasattr(client, "get_commit")
         assert hasattr(client, "get_commit_files")
+        assert hasattr(client, "get_commit_with_files")
         assert hasattr(client, "get_log")
 
 
@@ -165,6 +246,36 @@ class TestClientIsolation:
         assert client1.project_id == "project1"
         assert client2.project_id == "project2"
 
+    def test_github_session_created_once_across_threads(self):
+        """Threads making their first call together share one session."""
+        def slow_session():
+            time.sleep(0.05)
+            return Mock()
+
+        client = GitHubClient()
+        with patch("requests.Session", side_effect=slow_session) as session_cls:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                sessions = set(pool.map(lambda _: client._get_session(), range(8)))
+
+        assert session_cls.call_count == 1
+        assert len(sessions) == 1
+
+    def test_gharchive_client_created_once_across_threads(self):
+        """Credentials are resolved and the BigQuery client built once."""
+        def slow_credentials():
+            time.sleep(0.05)
+            return None, "project"
+
+        client = GHArchiveClient()
+        with patch.object(client, "_resolve_credentials", side_effect=slow_credentials) as resolve, \
+                patch("src.clients.gharchive.bigquery.Client") as bq_client:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                clients = set(pool.map(lambda _: id(client._get_client()), range(8)))
+
+        assert resolve.call_count == 1
+        assert bq_client.call_count == 1
+        assert len(clients) == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,93 @@
+"""
+Tests for GHArchiveCollector.
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from src.collectors.archive import GHArchiveCollector
+
+
+@pytest.fixture
+def mock_gharchive_client(gharchive_events):
+    client = Mock(table=None)
+    client.iter_events.side_effect = lambda **kwargs: (
+        e for e in gharchive_events if e["type"] in ("IssuesEvent", "CreateEvent")
+    )
+    return client
+
+
+def test_collect_events_multi_groups_by_type(mock_gharchive_client):
+    collector = GHArchiveCollector(client=mock_gharchive_client)
+    grouped = collector.collect_events_multi(
+        "202507130752",
+        ["IssuesEvent", "CreateEvent", "ForkEvent"],
+        repo="aws/aws-toolkit-vscode",
+    )
+
+    assert [e.event_type for e in grouped["IssuesEvent"]] == ["issue", "issue"]
+    assert [e.event_type for e in grouped["CreateEvent"]] == ["create"]
+    assert grouped["ForkEvent"] == []
+    mock_gharchive_client.iter_events.assert_called_once()
+    assert mock_gharchive_client.iter_events.call_args.kwargs["event_types"] == [
+        "IssuesEvent", "CreateEvent", "ForkEvent"
+    ]
+
+
+def test_collect_events_queries_single_type(mock_gharchive_client):
+    collector = GHArchiveCollector(client=mock_gharchive_client)
+    collector.collect_events("202507130752", repo="aws/aws-toolkit-vscode", event_type="IssuesEvent")
+
+    assert mock_gharchive_client.iter_events.call_args.kwargs["event_types"] == ["IssuesEvent"]
+
+
+def test_parsed_events_record_custom_table(mock_gharchive_client):
+    mock_gharchive_client.table = "my-project.raptor_test.gharchive_clustered"
+    collector = GHArchiveCollector(client=mock_gharchive_client)
+
+    events = collector.collect_events("202507130752", repo="aws/aws-toolkit-vscode", event_type="IssuesEvent")
+    grouped = collector.collect_events_multi("202507130752", ["IssuesEvent", "CreateEvent"], repo="aws/aws-toolkit-vscode")
+
+    tables = {e.verification.bigquery_table for e in events + grouped["CreateEvent"]}
+    assert tables == {"my-project.raptor_test.gharchive_clustered"}
+
+
+def test_collect_events_multi_validates_timestamp(mock_gharchive_client):
+    collector = GHArchiveCollector(client=mock_gharchive_client)
+    with pytest.raises(ValueError, match="YYYYMMDDHHMM"):
+        collector.collect_events_multi("2025071307", ["IssuesEvent"], repo="aws/aws-toolkit-vscode")
+
+
+def test_collect_events_multi_rejects_empty_event_types(mock_gharchive_client):
+    collector = GHArchiveCollector(client=mock_gharchive_client)
+    with pytest.raises(ValueError, match="at least one event type"):
+        collector.collect_events_multi("202507130752", [], repo="aws/aws-toolkit-vscode")
+    mock_gharchive_client.iter_events.assert_not_called()
+
+
+def test_table_id_configures_default_client():
+    collector = GHArchiveCollector(table_id="my-project.raptor_test.gharchive_clustered")
+    assert collector.client.table == "my-project.raptor_test.gharchive_clustered"
+
+
+def test_rejects_both_client_and_table_id(mock_gharchive_client):
+    with pytest.raises(ValueError, match="not both"):
+        GHArchiveCollector(client=mock_gharchive_client, table_id="my-project.raptor_test.gharchive_clustered")
+
+
+@pytest.mark.parametrize(
+    "table, expected",
+    [(None, "githubarchive.day.20250713"), ("my-project.raptor_test.gharchive_clustered", "my-project.raptor_test.gharchive_clustered")],
+)
+def test_recovered_evidence_records_queried_table(table, expected):
+    client = Mock(table=table)
+    client.query_events.return_value = [{
+        "created_at": "2025-07-13T20:30:24Z",
+        "actor_login": "lkmanka58",
+        "payload": {"size": 0, "before": "d" * 40},
+    }]
+    collector = GHArchiveCollector(client=client)
+
+    obs = collector.recover_force_push("aws/aws-toolkit-vscode", "2025-07-13T20:30:24")
+
+    assert obs.verification.bigquery_table == expected
@@ -12,7 +12,7 @@ from src.schema.common import EvidenceSource
 @pytest.fixture
 def mock_git_client():
     client = Mock()
-    client.get_commit.return_value = {
+    client.get_commit_with_files.return_value = {
         "sha": "a" * 40,
         "author_name": "Test Author",
         "author_email": "test@example.com",
@@ -22,10 +22,8 @@ def mock_git_client():
         "committer_date": "2023-01-01T00:00:00Z",
         "parents": [],
         "message": "Test commit message\n\nBody",
+        "files": [{"status": "modified", "filename": "test.py"}],
     }
-    client.get_commit_files.return_value = [
-        {"status": "modified", "filename": "test.py"}
-    ]
     return client
 
 
@@ -44,7 +42,7 @@ def test_collect_commit(mock_git_client):
 
 def test_collect_dangling_commits(mock_git_client):
     mock_git_client.fsck.return_value = f"dangling commit {'b' * 40}\n"
-    mock_git_client.get_commit.return_value = {
+    mock_git_client.get_commit_with_files.return_value = {
         "sha": "b" * 40,
         "author_name": "Dangler",
         "author_email": "dangler@example.com",
@@ -54,6 +52,7 @@ def test_collect_dangling_commits(mock_git_client):
         "committer_date": "2023-01-01T00:00:00Z",
         "parents": [],
         "message": "Dangling commit",
+        "files": [],
     }
     
     collector = LocalGitCollector(client=mock_git_client)
@@ -173,6 +173,17 @@ class TestMakeActor:
         assert actor.login == "testuser"
         assert actor.id is None
 
+    def test_interns_login(self):
+        """Equal logins built at runtime share one string object."""
+        first = make_actor("".join(["test", "user"]))
+        second = make_actor("".join(["test", "user"]))
+        assert first.login is second.login
+
+    def test_shares_instance_per_value(self):
+        """Same login and id return one shared (frozen) actor."""
+        assert make_actor("testuser", 12345) is make_actor("testuser", 12345)
+        assert make_actor("testuser", 12345) is not make_actor("testuser", 1)
+
 
 # =============================================================================
 # REPOSITORY CREATION TESTS
@@ -200,6 +211,13 @@ class TestMakeRepoFromFullName:
         assert repo.name == "aws-toolkit-vscode"
         assert repo.full_name == "aws/aws-toolkit-vscode"
 
+    def test_interns_names(self):
+        """Equal repository names parsed from rows share string objects."""
+        first = make_repo_from_full_name("/".join(["aws", "aws-toolkit-vscode"]))
+        second = make_repo_from_full_name("/".join(["aws", "aws-toolkit-vscode"]))
+        assert first.full_name is second.full_name
+        assert first.name is second.name
+
     def test_handles_no_slash(self):
         """Raises error for repo name without slash."""
         with pytest.raises(ValueError, match="must be 'owner/repo' format"):
@@ -8,6 +8,7 @@ Note: Helper function tests (generate_evidence_id, parse_datetime, etc.)
 are in test_helpers.py to avoid duplication.
 """
 
+import json
 import sys
 from pathlib import Path
 
@@ -21,6 +22,7 @@ from src.parsers import (
     parse_delete_event,
     parse_fork_event,
     parse_gharchive_event,
+    parse_gharchive_events,
     parse_issue_event,
     parse_member_event,
     parse_public_event,
@@ -66,6 +68,45 @@ class TestRowContext:
         ctx = _RowContext(row)
         assert ctx.payload["ref"] == "refs/heads/main"
 
+    def test_has_no_instance_dict(self):
+        """One context is built per row, so it stays slotted."""
+        row = {
+            "type": "PushEvent",
+            "created_at": "2025-07-13T20:37:04Z",
+            "actor_login": "testuser",
+            "actor_id": 123,
+            "repo_name": "owner/repo",
+            "payload": {},
+        }
+        assert not hasattr(_RowContext(row), "__dict__")
+
+    def test_json_string_payload_matches_stdlib_decoding(self):
+        """Payload decoding agrees with json.loads on unicode, numbers and nesting."""
+        data = {
+            "message": "fix: café \u2603 \U0001F680",
+            "size": 3,
+            "distinct_size": -1,
+            "ratio": 0.5,
+            "big": 2**53 + 1,
+            "huge": 123456789012345678901234567890,
+            "lone_surrogate": "\ud800",
+            "flags": [True, False, None],
+            "commits": [{"author": {"name": "Jürgen", "email": "j@example.com"}}],
+        }
+        # ensure_ascii=True writes the surrogate as a "\ud800" escape
+        for payload in (json.dumps(data, ensure_ascii=False), json.dumps(data)):
+            row = {
+                "type": "PushEvent",
+                "created_at": "2025-07-13T20:37:04Z",
+                "actor_login": "testuser",
+                "actor_id": 123,
+                "repo_name": "owner/repo",
+                "payload": payload,
+            }
+            ctx = _RowContext(row)
+            assert ctx.payload == json.loads(payload) == data
+            assert type(ctx.payload["huge"]) is int
+
     def test_creates_verification_info(self):
         """Creates VerificationInfo with GHARCHIVE source."""
         row = {
@@ -78,6 +119,20 @@ class TestRowContext:
         ctx = _RowContext(row)
         assert ctx.verification.source == EvidenceSource.GHARCHIVE
 
+    def test_shares_verification_per_table(self):
+        """Rows from the same table share one VerificationInfo."""
+        row = {
+            "type": "PushEvent",
+            "created_at": "2025-07-13T20:37:04Z",
+            "actor_login": "testuser",
+            "repo_name": "owner/repo",
+            "payload": {},
+        }
+        first = _RowContext(row).verification
+        assert _RowContext(dict(row, created_at="2025-07-14T08:00:00Z")).verification is first
+        assert first.bigquery_table == "githubarchive.month.202507"
+        assert _RowContext(row, table="githubarchive.day.20250713").verification is not first
+
 
 # =============================================================================
 # PARSER TESTS
@@ -186,6 +241,12 @@ class TestParseGharchiveEvent:
         with pytest.raises(ValueError, match="Unsupported"):
             parse_gharchive_event(row)
 
+    def test_batch_matches_per_row_parsing(self, gharchive_events):
+        """Batch parsing yields the same events, in order, from any iterable."""
+        batch = parse_gharchive_events(iter(gharchive_events), table="githubarchive.day.20250713")
+
+        assert batch == [parse_gharchive_event(row, "githubarchive.day.20250713") for row in gharchive_events]
+
 
 # =============================================================================
 # EDGE CASE TESTS
@@ -17,6 +17,7 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src import EvidenceStore, EvidenceSource, load_evidence_from_json
+from src.store import has_field
 
 
 # =============================================================================
@@ -32,12 +33,10 @@ class TestEvidenceStoreBasics:
         store = EvidenceStore()
         assert len(store) == 0
 
-    def test_add_and_get_evidence(self, sample_push_event_data):
+    def test_add_and_get_evidence(self, sample_push_event):
         """Add evidence and retrieve by ID."""
         store = EvidenceStore()
-        event = load_evidence_from_json(sample_push_event_data)
-
-        store.add(event)
+        store.add(sample_push_event)
 
         assert len(store) == 1
         assert store.get("push-test-001") is not None
@@ -58,40 +57,61 @@ class TestEvidenceStoreBasics:
         assert len(store) == 1
         assert store.get("push-test-001").what == "Modified description"
 
-    def test_remove_evidence(self, sample_push_event_data):
+    def test_add_replaced_entry_moves_to_end(self, sample_push_event, sample_commit_observation):
+        """Re-adding an existing ID places it at the end of iteration order."""
+        store = EvidenceStore()
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
+
+        store.add(sample_push_event)
+
+        assert [e.evidence_id for e in store] == ["commit-test-001", "push-test-001"]
+        assert [e.evidence_id for e in store.events] == ["push-test-001"]
+
+    def test_stored_evidence_is_immutable(self, sample_push_event):
+        """Evidence can't be edited in place, so the store's indexes can't go stale."""
+        from pydantic import ValidationError
+
+        store = EvidenceStore([sample_push_event])
+
+        with pytest.raises(ValidationError):
+            sample_push_event.repository = sample_push_event.repository.model_copy(update={"full_name": "x/y"})
+        with pytest.raises(ValidationError):
+            sample_push_event.repository.full_name = "x/y"
+        assert store.filter(repo="aws/aws-toolkit-vscode") == [sample_push_event]
+
+    def test_remove_evidence(self, sample_push_event):
         """Remove evidence by ID."""
         store = EvidenceStore()
-        event = load_evidence_from_json(sample_push_event_data)
-        store.add(event)
+        store.add(sample_push_event)
 
         assert store.remove("push-test-001") is True
         assert len(store) == 0
         assert store.remove("push-test-001") is False
 
-    def test_clear_store(self, sample_push_event_data, sample_commit_observation_data):
+    def test_clear_store(self, sample_push_event, sample_commit_observation):
         """Clear all evidence from store."""
         store = EvidenceStore()
-        store.add(load_evidence_from_json(sample_push_event_data))
-        store.add(load_evidence_from_json(sample_commit_observation_data))
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
 
         assert len(store) == 2
         store.clear()
         assert len(store) == 0
 
-    def test_contains_check(self, sample_push_event_data):
+    def test_contains_check(self, sample_push_event):
         """Check if evidence ID exists in store."""
         store = EvidenceStore()
-        event = load_evidence_from_json(sample_push_event_data)
-        store.add(event)
+        store.add(sample_push_event)
 
         assert "push-test-001" in store
         assert "nonexistent" not in store
 
-    def test_iterate_over_store(self, sample_push_event_data, sample_commit_observation_data):
+    def test_iterate_over_store(self, sample_push_event, sample_commit_observation):
         """Iterate over all evidence in store."""
         store = EvidenceStore()
-        store.add(load_evidence_from_json(sample_push_event_data))
-        store.add(load_evidence_from_json(sample_commit_observation_data))
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
 
         evidence_ids = [e.evidence_id for e in store]
         assert len(evidence_ids) == 2
@@ -107,22 +127,22 @@ class TestEvidenceStoreBasics:
 class TestEvidenceStoreFiltering:
     """Test store filtering capabilities."""
 
-    def test_filter_by_event_type(self, sample_push_event_data, sample_commit_observation_data):
+    def test_filter_by_event_type(self, sample_push_event, sample_commit_observation):
         """Filter by event type."""
         store = EvidenceStore()
-        store.add(load_evidence_from_json(sample_push_event_data))
-        store.add(load_evidence_from_json(sample_commit_observation_data))
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
 
         push_events = store.filter(event_type="push")
         assert len(push_events) == 1
         assert push_events[0].evidence_id == "push-test-001"
 
-    def test_filter_by_observation_type(self, sample_push_event_data, sample_commit_observation_data, sample_ioc_data):
+    def test_filter_by_observation_type(self, sample_push_event, sample_commit_observation, sample_ioc):
         """Filter by observation type."""
         store = EvidenceStore()
-        store.add(load_evidence_from_json(sample_push_event_data))
-        store.add(load_evidence_from_json(sample_commit_observation_data))
-        store.add(load_evidence_from_json(sample_ioc_data))
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
+        store.add(sample_ioc)
 
         commits = store.filter(observation_type="commit")
         assert len(commits) == 1
@@ -131,11 +151,11 @@ class TestEvidenceStoreFiltering:
         iocs = store.filter(observation_type="ioc")
         assert len(iocs) == 1
 
-    def test_filter_by_source(self, sample_push_event_data, sample_commit_observation_data):
+    def test_filter_by_source(self, sample_push_event, sample_commit_observation):
         """Filter by verification source."""
         store = EvidenceStore()
-        store.add(load_evidence_from_json(sample_push_event_data))
-        store.add(load_evidence_from_json(sample_commit_observation_data))
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
 
         github_evidence = store.filter(source=EvidenceSource.GITHUB)
         assert len(github_evidence) == 1
@@ -143,11 +163,11 @@ class TestEvidenceStoreFiltering:
         gharchive_evidence = store.filter(source="gharchive")
         assert len(gharchive_evidence) == 1
 
-    def test_filter_by_repository(self, sample_push_event_data, sample_commit_observation_data):
+    def test_filter_by_repository(self, sample_push_event, sample_commit_observation):
         """Filter by repository."""
         store = EvidenceStore()
-        store.add(load_evidence_from_json(sample_push_event_data))
-        store.add(load_evidence_from_json(sample_commit_observation_data))
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
 
         aws_evidence = store.filter(repo="aws/aws-toolkit-vscode")
         assert len(aws_evidence) == 2
@@ -155,11 +175,28 @@ class TestEvidenceStoreFiltering:
         other_evidence = store.filter(repo="other/repo")
         assert len(other_evidence) == 0
 
-    def test_filter_by_date_range(self, sample_push_event_data, sample_commit_observation_data):
+    def test_filter_combines_indexed_criteria(self, sample_push_event, sample_commit_observation, sample_ioc):
+        """Indexed criteria intersect, keep store order, and follow removals."""
+        store = EvidenceStore([sample_commit_observation, sample_ioc, sample_push_event])
+
+        assert store.filter(observation_type="commit", source="github", repo="aws/aws-toolkit-vscode") == [
+            sample_commit_observation
+        ]
+        assert store.filter(event_type="push", source="github") == []
+        assert store.filter(repo="aws/aws-toolkit-vscode") == [sample_commit_observation, sample_push_event]
+
+        store.add(sample_commit_observation)
+        assert store.filter(repo="aws/aws-toolkit-vscode") == [sample_push_event, sample_commit_observation]
+
+        store.remove("commit-test-001")
+        assert store.filter(observation_type="commit") == []
+        assert store.filter(source="github") == []
+
+    def test_filter_by_date_range(self, sample_push_event, sample_commit_observation):
         """Filter by date range."""
         store = EvidenceStore()
-        store.add(load_evidence_from_json(sample_push_event_data))
-        store.add(load_evidence_from_json(sample_commit_observation_data))
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
 
         # Filter after July 1st
         after_july = store.filter(after=datetime(2025, 7, 1, tzinfo=timezone.utc))
@@ -173,36 +210,111 @@ class TestEvidenceStoreFiltering:
         future = store.filter(after=datetime(2026, 1, 1, tzinfo=timezone.utc))
         assert len(future) == 0
 
-    def test_filter_with_predicate(self, sample_push_event_data, sample_commit_observation_data):
+    def test_filter_by_date_uses_store_order(self, sample_push_event):
+        """Date hits keep store order, bounds are inclusive and removal is tracked."""
+        def at(eid, day):
+            when = datetime(2025, 7, day, tzinfo=timezone.utc)
+            return sample_push_event.model_copy(update={"evidence_id": eid, "when": when})
+
+        late, early, middle = at("late", 20), at("early", 10), at("middle", 15)
+        store = EvidenceStore([late, early, middle])
+
+        july_10, july_15 = datetime(2025, 7, 10, tzinfo=timezone.utc), datetime(2025, 7, 15, tzinfo=timezone.utc)
+        assert store.filter(after=july_10) == [late, early, middle]
+        assert store.filter(after=july_10, before=july_15) == [early, middle]
+        assert store.filter(before=datetime(2025, 7, 15)) == [early, middle]  # naive is UTC
+
+        store.add(early)
+        store.remove("middle")
+        assert store.filter(after=july_10) == [late, early]
+        assert store.filter(after=july_10, event_type="push") == [late, early]
+
+    def test_filter_by_date_after_batch_and_single_updates(self, sample_push_event):
+        """Batch adds, removals and single adds before and after a date query agree."""
+        def at(eid, day):
+            when = datetime(2025, 7, day, tzinfo=timezone.utc)
+            return sample_push_event.model_copy(update={"evidence_id": eid, "when": when})
+
+        july_12 = datetime(2025, 7, 12, tzinfo=timezone.utc)
+        store = EvidenceStore([at(f"day-{day}", day) for day in (20, 3, 14, 9, 11)])
+        store.remove("day-14")
+        store.add(at("day-16", 16))
+        store.add_all([at("day-2", 2), at("day-25", 25)])
+
+        assert [e.evidence_id for e in store.filter(after=july_12)] == ["day-20", "day-16", "day-25"]
+
+        store.add(at("day-13", 13))
+        store.remove("day-20")
+        assert [e.evidence_id for e in store.filter(after=july_12)] == ["day-16", "day-25", "day-13"]
+        assert [e.evidence_id for e in store.filter(before=july_12)] == ["day-3", "day-9", "day-11", "day-2"]
+
+    def test_accepts_generators(self, sample_push_event, sample_commit_observation, sample_ioc):
+        """The constructor and add_all take any iterable, not just sequences."""
+        store = EvidenceStore(e for e in [sample_push_event, sample_commit_observation])
+        store.add_all(e for e in [sample_ioc])
+
+        assert len(store) == 3
+        assert store.filter(after=datetime(2025, 7, 20, tzinfo=timezone.utc)) == [sample_ioc]
+
+    def test_filter_by_date_falls_back_to_observed_when(self, sample_ioc):
+        """Observations without original_when are dated by observed_when."""
+        store = EvidenceStore()
+        store.add(sample_ioc)  # observed 2025-07-24
+
+        assert len(store.filter(after=datetime(2025, 7, 20, tzinfo=timezone.utc))) == 1
+        assert len(store.filter(before=datetime(2025, 7, 20, tzinfo=timezone.utc))) == 0
+
+    def test_filter_with_predicate(self, sample_push_event, sample_commit_observation):
         """Filter with custom predicate."""
         store = EvidenceStore()
-        store.add(load_evidence_from_json(sample_push_event_data))
-        store.add(load_evidence_from_json(sample_commit_observation_data))
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
 
         # Custom predicate
         has_sha = store.filter(predicate=lambda e: hasattr(e, "sha"))
         assert len(has_sha) == 1
 
-    def test_events_property(self, sample_push_event_data, sample_commit_observation_data):
+    def test_filter_with_has_field_predicate(self, sample_push_event, sample_commit_observation):
+        """has_field answers from declared model fields."""
+        store = EvidenceStore([sample_push_event, sample_commit_observation])
+
+        assert store.filter(predicate=lambda e: has_field(e, "sha")) == [sample_commit_observation]
+        assert has_field(sample_push_event, "before_sha")
+        assert not has_field(sample_push_event, "model_dump")  # a method, not a field
+
+    def test_events_property(self, sample_push_event, sample_commit_observation):
         """Get all events via property."""
         store = EvidenceStore()
-        store.add(load_evidence_from_json(sample_push_event_data))
-        store.add(load_evidence_from_json(sample_commit_observation_data))
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
 
         events = store.events
         assert len(events) == 1
         assert events[0].evidence_id == "push-test-001"
 
-    def test_observations_property(self, sample_push_event_data, sample_commit_observation_data, sample_ioc_data):
+    def test_observations_property(self, sample_push_event, sample_commit_observation, sample_ioc):
         """Get all observations via property."""
         store = EvidenceStore()
-        store.add(load_evidence_from_json(sample_push_event_data))
-        store.add(load_evidence_from_json(sample_commit_observation_data))
-        store.add(load_evidence_from_json(sample_ioc_data))
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
+        store.add(sample_ioc)
 
         observations = store.observations
         assert len(observations) == 2
 
+    def test_kind_properties_track_mutations(self, sample_push_event, sample_commit_observation):
+        """Events/observations reflect removals and clears."""
+        store = EvidenceStore()
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
+
+        store.remove("push-test-001")
+        assert store.events == []
+        assert [o.evidence_id for o in store.observations] == ["commit-test-001"]
+
+        store.clear()
+        assert store.observations == []
+
 
 # =============================================================================
 # STORE SERIALIZATION
@@ -212,11 +324,11 @@ class TestEvidenceStoreFiltering:
 class TestEvidenceStoreSerialization:
     """Test store save/load functionality."""
 
-    def test_to_json(self, sample_push_event_data, sample_commit_observation_data):
+    def test_to_json(self, sample_push_event, sample_commit_observation):
         """Serialize store to JSON string."""
         store = EvidenceStore()
-        store.add(load_evidence_from_json(sample_push_event_data))
-        store.add(load_evidence_from_json(sample_commit_observation_data))
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
 
         json_str = store.to_json()
         data = json.loads(json_str)
@@ -224,12 +336,35 @@ class TestEvidenceStoreSerialization:
         assert isinstance(data, list)
         assert len(data) == 2
 
-    def test_from_json(self, sample_push_event_data, sample_commit_observation_data):
+    @pytest.mark.parametrize("indent", [None, 0, 2, 4])
+    def test_streamed_json_matches_full_dump(self, indent, sample_push_event, sample_commit_observation):
+        """Streamed chunks concatenate to the same document as a single dump."""
+        store = EvidenceStore()
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
+
+        expected = json.dumps([e.model_dump(mode="json") for e in store], indent=indent)
+        streamed = "".join(store.iter_json(indent))
+
+        assert json.loads(streamed) == json.loads(expected)
+        if indent is not None:
+            assert streamed == expected  # same layout as json.dumps
+        assert EvidenceStore().to_json(indent) == json.dumps([], indent=indent)
+
+    def test_save_and_load_non_ascii(self, tmp_path, sample_push_event):
+        """Unescaped non-ASCII text round-trips through a saved file."""
+        store = EvidenceStore([sample_push_event.model_copy(update={"what": "Pushed café ☃"})])
+
+        store.save(tmp_path / "evidence.json")
+
+        assert EvidenceStore.load(tmp_path / "evidence.json").get("push-test-001").what == "Pushed café ☃"
+
+    def test_from_json(self, sample_push_event, sample_commit_observation):
         """Create store from JSON string."""
         # Create and serialize
         store1 = EvidenceStore()
-        store1.add(load_evidence_from_json(sample_push_event_data))
-        store1.add(load_evidence_from_json(sample_commit_observation_data))
+        store1.add(sample_push_event)
+        store1.add(sample_commit_observation)
         json_str = store1.to_json()
 
         # Deserialize
@@ -239,15 +374,15 @@ class TestEvidenceStoreSerialization:
         assert store2.get("push-test-001") is not None
         assert store2.get("commit-test-001") is not None
 
-    def test_save_and_load(self, sample_push_event_data, sample_commit_observation_data):
+    def test_save_and_load(self, sample_push_event, sample_commit_observation):
         """Save to file and load back."""
         with tempfile.TemporaryDirectory() as tmpdir:
             filepath = Path(tmpdir) / "evidence.json"
 
             # Save
             store1 = EvidenceStore()
-            store1.add(load_evidence_from_json(sample_push_event_data))
-            store1.add(load_evidence_from_json(sample_commit_observation_data))
+            store1.add(sample_push_event)
+            store1.add(sample_commit_observation)
             store1.save(filepath)
 
             # Load
@@ -256,17 +391,35 @@ class TestEvidenceStoreSerialization:
             assert len(store2) == 2
             assert store2.get("push-test-001") is not None
 
-    def test_save_creates_directories(self, sample_push_event_data):
+    def test_save_creates_directories(self, sample_push_event):
         """Save creates parent directories if needed."""
         with tempfile.TemporaryDirectory() as tmpdir:
             filepath = Path(tmpdir) / "nested" / "path" / "evidence.json"
 
             store = EvidenceStore()
-            store.add(load_evidence_from_json(sample_push_event_data))
+            store.add(sample_push_event)
             store.save(filepath)
 
             assert filepath.exists()
 
+    def test_failed_save_keeps_previous_file(self, tmp_path, monkeypatch, sample_push_event):
+        """An interrupted save leaves the existing file and no temp file."""
+        filepath = tmp_path / "evidence.json"
+        store = EvidenceStore([sample_push_event])
+        store.save(filepath)
+        before = filepath.read_bytes()
+
+        def interrupted(self, indent=2):
+            yield "[\n"
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(EvidenceStore, "iter_json", interrupted)
+        with pytest.raises(RuntimeError):
+            store.save(filepath)
+
+        assert filepath.read_bytes() == before
+        assert list(tmp_path.iterdir()) == [filepath]
+
 
 # =============================================================================
 # STORE MERGE AND SUMMARY
@@ -276,14 +429,14 @@ class TestEvidenceStoreSerialization:
 class TestEvidenceStoreMerge:
     """Test store merge and summary."""
 
-    def test_merge_stores(self, sample_push_event_data, sample_commit_observation_data, sample_ioc_data):
+    def test_merge_stores(self, sample_push_event, sample_commit_observation, sample_ioc):
         """Merge two stores."""
         store1 = EvidenceStore()
-        store1.add(load_evidence_from_json(sample_push_event_data))
+        store1.add(sample_push_event)
 
         store2 = EvidenceStore()
-        store2.add(load_evidence_from_json(sample_commit_observation_data))
-        store2.add(load_evidence_from_json(sample_ioc_data))
+        store2.add(sample_commit_observation)
+        store2.add(sample_ioc)
 
         store1.merge(store2)
 
@@ -292,12 +445,12 @@ class TestEvidenceStoreMerge:
         assert "commit-test-001" in store1
         assert "ioc-test-001" in store1
 
-    def test_summary(self, sample_push_event_data, sample_commit_observation_data, sample_ioc_data):
+    def test_summary(self, sample_push_event, sample_commit_observation, sample_ioc):
         """Get store summary."""
         store = EvidenceStore()
-        store.add(load_evidence_from_json(sample_push_event_data))
-        store.add(load_evidence_from_json(sample_commit_observation_data))
-        store.add(load_evidence_from_json(sample_ioc_data))
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
+        store.add(sample_ioc)
 
         summary = store.summary()
 
@@ -309,6 +462,24 @@ class TestEvidenceStoreMerge:
         assert "github" in summary["by_source"]
         assert "security_vendor" in summary["by_source"]
 
+    def test_summary_tracks_replace_and_remove(self, sample_push_event, sample_commit_observation):
+        """Summary counts follow replacements and removals."""
+        store = EvidenceStore()
+        store.add(sample_push_event)
+        store.add(sample_push_event)
+        store.add(sample_commit_observation)
+
+        assert store.summary()["events"] == {"push": 1}
+
+        store.remove("commit-test-001")
+
+        assert store.summary() == {
+            "total": 1,
+            "events": {"push": 1},
+            "observations": {},
+            "by_source": {"gharchive": 1},
+        }
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
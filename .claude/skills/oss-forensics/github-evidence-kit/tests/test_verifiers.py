@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ConsistencyVerifier.
+
+Uses mocked clients - no network access required.
+Fixtures are defined in conftest.py.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.verifiers import ConsistencyVerifier
+
+
+@pytest.fixture
+def github_client():
+    client = Mock()
+    client.get_commit.return_value = {
+        "sha": "678851bbe9776228f55e0460e66a6167ac2a1685",
+        "commit": {
+            "message": "fix(amazonq): test commit",
+            "author": {"name": "lkmanka58"},
+        },
+    }
+    return client
+
+
+@pytest.fixture
+def verifier(github_client):
+    return ConsistencyVerifier(github_client=github_client, gharchive_client=Mock())
+
+
+# =============================================================================
+# DISPATCH
+# =============================================================================
+
+
+class TestVerifierDispatch:
+    """Test routing of evidence to the right verifier."""
+
+    def test_unknown_evidence_type(self, verifier):
+        """Objects that are neither events nor observations are rejected."""
+        result = verifier.verify(object())
+        assert result.is_valid is False
+        assert result.errors == ["Unknown evidence type"]
+
+    def test_github_commit_uses_commit_verifier(self, verifier, github_client, sample_commit_observation):
+        """GitHub commit observations are checked against the commit API."""
+        result = verifier.verify(sample_commit_observation)
+
+        assert result.is_valid is True
+        github_client.get_commit.assert_called_once_with(
+            "aws", "aws-toolkit-vscode", "678851bbe9776228f55e0460e66a6167ac2a1685"
+        )
+
+    def test_local_git_observation_is_accepted(self, verifier, sample_commit_observation_data):
+        """Local git evidence is accepted with an explanatory note."""
+        from src import load_evidence_from_json
+
+        sample_commit_observation_data["verification"] = {"source": "git"}
+        result = verifier.verify(load_evidence_from_json(sample_commit_observation_data))
+
+        assert result.is_valid is True
+        assert result.errors == ["Local git verification not supported"]
+
+    def test_verify_all_prefixes_errors_with_evidence_id(self, verifier, github_client, sample_commit_observation):
+        """Aggregated errors carry the evidence ID."""
+        github_client.get_commit.return_value["sha"] = "0" * 40
+
+        result = verifier.verify_all([sample_commit_observation])
+
+        assert result.is_valid is False
+        assert result.errors[0].startswith("[commit-test-001] SHA mismatch")
+
+    def test_verify_all_concurrent_keeps_input_order(self, verifier, sample_commit_observation_data):
+        """Concurrent verification reports errors in input order."""
+        from src import load_evidence_from_json
+
+        evidence = []
+        for i in range(5):
+            data = dict(sample_commit_observation_data, evidence_id=f"commit-{i}")
+            data["repository"] = None
+            evidence.append(load_evidence_from_json(data))
+
+        result = verifier.verify_all(evidence, max_workers=4)
+
+        assert [e.split("]")[0] for e in result.errors] == [f"[commit-{i}" for i in range(5)]
+
+    def test_verify_all_is_sequential_by_default(self, verifier, github_client, sample_commit_observation_data):
+        """Without max_workers, every item is checked on the calling thread."""
+        from src import load_evidence_from_json
+
+        threads = set()
+        github_client.get_commit.side_effect = lambda *args: threads.add(threading.get_ident()) or {}
+        evidence = [
+            load_evidence_from_json(dict(sample_commit_observation_data, evidence_id=f"commit-{i}", sha=f"{i}" * 40))
+            for i in range(3)
+        ]
+
+        verifier.verify_all(evidence)
+
+        assert threads == {threading.get_ident()}
+
+
+# =============================================================================
+# REQUEST DEDUPLICATION
+# =============================================================================
+
+
+class TestVerifierDeduplication:
+    """Test that verify_all fetches each upstream entity once."""
+
+    def test_shared_commit_fetched_once(self, verifier, github_client, sample_commit_observation_data):
+        """Observations of the same commit share one API response."""
+        from src import load_evidence_from_json
+
+        evidence = [
+            load_evidence_from_json(dict(sample_commit_observation_data, evidence_id=f"commit-{i}"))
+            for i in range(3)
+        ]
+
+        result = verifier.verify_all(evidence, max_workers=1)
+
+        assert result.is_valid is True
+        github_client.get_commit.assert_called_once()
+
+    def test_shared_commit_fetched_once_concurrently(self, verifier, github_client, sample_commit_observation_data):
+        """Concurrent workers wait on the first fetch instead of repeating it."""
+        from src import load_evidence_from_json
+
+        response = github_client.get_commit.return_value
+        github_client.get_commit.side_effect = lambda *args: time.sleep(0.05) or response
+        evidence = [
+            load_evidence_from_json(dict(sample_commit_observation_data, evidence_id=f"commit-{i}"))
+            for i in range(8)
+        ]
+
+        result = verifier.verify_all(evidence, max_workers=8)
+
+        assert result.is_valid is True
+        github_client.get_commit.assert_called_once()
+
+    def test_failed_fetch_is_reused(self, verifier, github_client, sample_commit_observation_data):
+        """A missing commit is requested once; every observation sees the error."""
+        from src import load_evidence_from_json
+
+        github_client.get_commit.side_effect = RuntimeError("404 Not Found")
+        evidence = [
+            load_evidence_from_json(dict(sample_commit_observation_data, evidence_id=f"commit-{i}"))
+            for i in range(3)
+        ]
+
+        result = verifier.verify_all(evidence, max_workers=3)
+
+        github_client.get_commit.assert_called_once()
+        assert result.errors == [f"[commit-{i}] Verification failed: 404 Not Found" for i in range(3)]
+
+    def test_memo_does_not_outlive_verify_all(self, verifier, github_client, sample_commit_observation):
+        """Separate runs re-fetch, so later verifications see fresh data."""
+        verifier.verify_all([sample_commit_observation])
+        verifier.verify_all([sample_commit_observation])
+
+        assert github_client.get_commit.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])